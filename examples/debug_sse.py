@@ -3,8 +3,34 @@
 Quick SSE Debug Tool - Test streaming directly
 """
 import asyncio
+import os
+from typing import Optional
+
 import aiohttp
-import json
+
+# Echo every raw line only when asked; printing dominates on busy streams
+DEBUG = bool(os.getenv("DEBUG"))
+
+# Shared across runs so repeated streams reuse pooled connections and DNS
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it inside the running loop"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, ttl_dns_cache=300)
+        )
+    return _session
+
+
+async def close_session():
+    """Close the shared session"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
 
 
 async def debug_sse_stream():
@@ -14,47 +40,68 @@ async def debug_sse_stream():
     url = "http://localhost:8081/stream/tools/file_ops"
     params = {"operation": "list", "path": "."}
     
-    async with aiohttp.ClientSession() as session:
-        print(f"📡 Connecting to: {url}")
-        print(f"📋 Params: {params}")
-        
-        try:
-            async with session.get(url, params=params) as response:
-                print(f"📊 Status: {response.status}")
-                print(f"📜 Headers: {dict(response.headers)}")
+    session = _get_session()
+    print(f"📡 Connecting to: {url}")
+    print(f"📋 Params: {params}")
+    
+    try:
+        async with session.get(url, params=params) as response:
+            print(f"📊 Status: {response.status}")
+            print(f"📜 Headers: {dict(response.headers)}")
+            
+            if response.status != 200:
+                error_text = await response.text()
+                print(f"❌ Error: {error_text}")
+                return
+            
+            print("🌊 Reading SSE stream...")
+            pending = bytearray()
+            frame = []
+            message_count = 0
+            
+            async for chunk in response.content.iter_chunked(65536):
+                pending += chunk
+                start = 0
                 
-                if response.status != 200:
-                    error_text = await response.text()
-                    print(f"❌ Error: {error_text}")
-                    return
+                while message_count < 5:
+                    end = pending.find(b"\n", start)
+                    if end < 0:
+                        break
+                    line = bytes(pending[start:end]).rstrip(b"\r")
+                    start = end + 1
+                    
+                    if DEBUG:
+                        print(f"📨 Line: {line!r}")
+                    
+                    if line:
+                        frame.append(line)
+                    elif frame:
+                        # End of message - decode the whole frame once
+                        lines = b"\n".join(frame).decode("utf-8").split("\n")
+                        print(f"🔍 Message {message_count}: {lines}")
+                        message_count += 1
+                        frame = []
                 
-                print("🌊 Reading SSE stream...")
-                buffer = []
-                message_count = 0
+                del pending[:start]
                 
-                async for line in response.content:
-                    line_str = line.decode('utf-8').rstrip('\r\n')
-                    print(f"📨 Line: {repr(line_str)}")
-                    
-                    if line_str == '':
-                        # End of message
-                        if buffer:
-                            print(f"🔍 Message {message_count}: {buffer}")
-                            message_count += 1
-                            buffer = []
-                    else:
-                        buffer.append(line_str)
+                # Stop after a few messages for debugging
+                if message_count >= 5:
+                    break
                     
-                    # Stop after a few messages for debugging
-                    if message_count >= 5:
-                        break
-                        
-        except Exception as e:
-            print(f"❌ Stream error: {e}")
-            import traceback
-            traceback.print_exc()
+    except Exception as e:
+        print(f"❌ Stream error: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+
+async def main():
+    try:
+        await debug_sse_stream()
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
     print("🚀 Make sure SSE server is running with DEBUG logging")
-    asyncio.run(debug_sse_stream())
+    asyncio.run(main())
@@ -11,13 +11,42 @@ Provides user-friendly commands for MCP server interaction:
 import asyncio
 import json
 import logging
+import re
 import sys
-from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+from mcp_client.fastjson import dumps_pretty
 from protocol import MCPClient, MCPTool
 from transport import StdioTransport
 
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.patch_stdout import patch_stdout
+except ImportError:
+    PromptSession = None
+
+# Splits "<word> <rest>" in one pass; used for commands and "call" arguments
+_CMD_RE = re.compile(r"\s*(\S+)\s*(.*)", re.S)
+
+# Shared read-only fallback for missing server info; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+
+def _format_text(item: Dict[str, Any]) -> str:
+    return f"  📄 {item.get('text', '')}\n"
+
+
+def _format_image(item: Dict[str, Any]) -> str:
+    return f"  🖼️  Image: {item.get('data', 'No data')[:50]}...\n"
+
+
+def _format_other(item: Dict[str, Any]) -> str:
+    return f"  📦 {dumps_pretty(item)}\n"
+
+
+# Content item type -> line formatter for _pretty_print_result
+_FORMATTERS = {"text": _format_text, "image": _format_image}
+
 
 class MCPCliClient:
     """Interactive CLI wrapper for MCP client"""
@@ -26,6 +55,17 @@ class MCPCliClient:
         self.server_command = server_command
         self.client: Optional[MCPClient] = None
         self.running = False
+        self._session = None
+        self._tools_rendered: Optional[str] = None
+        self._commands = {
+            "help": self._cmd_help,
+            "list": self._cmd_list,
+            "call": self._cmd_call,
+            "info": self._cmd_info,
+            "exit": self._cmd_exit,
+            "quit": self._cmd_exit,
+            "q": self._cmd_exit,
+        }
 
     async def start(self) -> bool:
         """Initialize connection and start CLI"""
@@ -34,9 +74,14 @@ class MCPCliClient:
         transport = StdioTransport(self.server_command)
         self.client = MCPClient(transport)
 
+        if PromptSession is not None:
+            self._session = PromptSession()
+
         success = await self.client.initialize()
         if success:
-            print(f"✅ Connected! Server: {self.client.server_info.get('serverInfo', {}).get('name', 'Unknown')}")
+            self._tools_rendered = self._render_tools()
+            info = self.client.server_info.get("serverInfo") or _EMPTY
+            print(f"✅ Connected! Server: {info.get('name', 'Unknown')}")
             print(f"📦 Available tools: {len(self.client.tools)}")
             print("Type 'help' for commands or 'list' to see tools\n")
             return True
@@ -65,27 +110,27 @@ class MCPCliClient:
 
     async def _get_input(self, prompt: str) -> str:
         """Async input handling"""
-        return await asyncio.get_event_loop().run_in_executor(None, input, prompt)
+        if self._session is not None:
+            # prompt_toolkit reads stdin on the event loop itself, no thread hop
+            with patch_stdout():
+                return await self._session.prompt_async(prompt)
+        return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
 
     async def _execute_command(self, command: str) -> None:
         """Parse and execute CLI commands"""
-        parts = command.split(maxsplit=1)
-        cmd = parts[0].lower()
-        args = parts[1] if len(parts) > 1 else ""
-
-        if cmd == "help":
-            await self._cmd_help(args)
-        elif cmd == "list":
-            await self._cmd_list()
-        elif cmd == "call":
-            await self._cmd_call(args)
-        elif cmd in ("exit", "quit", "q"):
-            self.running = False
-        elif cmd == "info":
-            await self._cmd_info()
-        else:
+        match = _CMD_RE.match(command)
+        if match is None:
+            return
+        cmd = match.group(1).lower()
+        args = match.group(2)
+
+        handler = self._commands.get(cmd)
+        if handler is None:
             print(f"❓ Unknown command: {cmd}")
             await self._cmd_help("")
+            return
+
+        await handler(args)
 
     async def _cmd_help(self, tool_name: str = "") -> None:
         """Show help for commands or specific tool"""
@@ -95,7 +140,7 @@ class MCPCliClient:
                 print(f"\n🔧 Tool: {tool.name}")
                 print(f"📝 Description: {tool.description}")
                 print(f"⚙️  Input Schema:")
-                print(json.dumps(tool.input_schema, indent=2))
+                print(tool.schema_pretty)
                 print(f"\n💡 Usage: call {tool.name} {{\"arg\": \"value\"}}")
             else:
                 print(f"❌ Tool '{tool_name}' not found")
@@ -108,17 +153,24 @@ class MCPCliClient:
             print("  exit/quit/q    - Close connection and exit")
             print("\n💡 Example: call echo {\"text\": \"Hello World!\"}")
 
-    async def _cmd_list(self) -> None:
+    async def _cmd_list(self, args: str = "") -> None:
         """List all available tools"""
         if not self.client or not self.client.tools:
             print("❌ No tools available")
             return
 
-        print(f"\n🔧 Available Tools ({len(self.client.tools)}):")
+        if self._tools_rendered is None:
+            self._tools_rendered = self._render_tools()
+        sys.stdout.write(self._tools_rendered)
+
+    def _render_tools(self) -> str:
+        """Render the tool listing once; tools only change on (re)discovery"""
+        lines = [f"\n🔧 Available Tools ({len(self.client.tools)}):"]
         for i, tool in enumerate(self.client.tools, 1):
-            print(f"  {i}. {tool.name}")
-            print(f"     {tool.description}")
-        print("\n💡 Use 'help <tool>' for details or 'call <tool> <args>' to execute")
+            lines.append(f"  {i}. {tool.name}")
+            lines.append(f"     {tool.description}")
+        lines.append("\n💡 Use 'help <tool>' for details or 'call <tool> <args>' to execute\n")
+        return "\n".join(lines)
 
     async def _cmd_call(self, args: str) -> None:
         """Execute a tool call"""
@@ -127,9 +179,12 @@ class MCPCliClient:
             return
 
         # Parse tool name and arguments
-        parts = args.split(maxsplit=1)
-        tool_name = parts[0]
-        json_args = parts[1] if len(parts) > 1 else "{}"
+        match = _CMD_RE.match(args)
+        if match is None:
+            print("❌ Usage: call <tool_name> <json_arguments>")
+            return
+        tool_name = match.group(1)
+        json_args = match.group(2) or "{}"
 
         # Validate tool exists
         tool = self._find_tool(tool_name)
@@ -153,7 +208,7 @@ class MCPCliClient:
         except Exception as e:
             print(f"❌ Tool execution failed: {e}")
 
-    async def _cmd_info(self) -> None:
+    async def _cmd_info(self, args: str = "") -> None:
         """Show server information"""
         if not self.client:
             print("❌ Not connected to server")
@@ -161,33 +216,33 @@ class MCPCliClient:
 
         print(f"\n📊 Server Information:")
         print(f"  Protocol Version: {self.client.server_info.get('protocolVersion', 'Unknown')}")
-        server_info = self.client.server_info.get('serverInfo', {})
+        server_info = self.client.server_info.get('serverInfo') or _EMPTY
         print(f"  Server Name: {server_info.get('name', 'Unknown')}")
         print(f"  Server Version: {server_info.get('version', 'Unknown')}")
         print(f"  Tools Available: {len(self.client.tools)}")
 
-    @lru_cache(maxsize=128)
+    async def _cmd_exit(self, args: str = "") -> None:
+        """Stop the CLI loop"""
+        self.running = False
+
     def _find_tool(self, name: str) -> Optional[MCPTool]:
-        """Find tool by name (cached for performance)"""
+        """Find tool by name via the client's name index"""
         if not self.client:
             return None
-        return next((tool for tool in self.client.tools if tool.name == name), None)
+        return self.client.tools_by_name.get(name)
 
     def _pretty_print_result(self, result: Dict[str, Any]) -> None:
         """Pretty print tool execution results"""
         content = result.get('content', [])
 
         if not content:
-            print(json.dumps(result, indent=2))
+            print(dumps_pretty(result))
             return
 
-        for item in content:
-            if item.get('type') == 'text':
-                print(f"  📄 {item.get('text', '')}")
-            elif item.get('type') == 'image':
-                print(f"  🖼️  Image: {item.get('data', 'No data')[:50]}...")
-            else:
-                print(f"  📦 {json.dumps(item, indent=2)}")
+        # One write for the whole result instead of a print per item
+        sys.stdout.write("".join(
+            _FORMATTERS.get(item.get('type'), _format_other)(item) for item in content
+        ))
 
     async def close(self) -> None:
         """Clean shutdown"""
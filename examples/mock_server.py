@@ -3,9 +3,29 @@
 Mock MCP Server for testing the CLI client.
 Provides a few sample tools to demonstrate functionality.
 """
+import select
 import sys
 import json
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+
+def _stdin_pending() -> bool:
+    """True when more request bytes are already waiting on stdin"""
+    try:
+        return bool(select.select([sys.stdin], [], [], 0)[0])
+    except (OSError, ValueError):
+        return False
+
 
 def mock_mcp_server():
     """Simple mock MCP server with sample tools"""
@@ -94,10 +114,18 @@ def mock_mcp_server():
         else:
             return {"error": {"code": -1, "message": f"Unknown tool: {tool_name}"}}
     
-    # Main server loop
-    for line in sys.stdin:
+    # Static responses are serialized once; only the id is spliced in per request
+    static_heads = {
+        method: _dumps(body)[:-1] + b',"id":' for method, body in responses.items()
+    }
+    
+    inp = sys.stdin.buffer
+    out = sys.stdout.buffer
+
+    # Main server loop - raw bytes lines go straight to the parser
+    for line in inp:
         try:
-            msg = json.loads(line.strip())
+            msg = _loads(line)
             method = msg.get("method")
             msg_id = msg.get("id")
             
@@ -105,16 +133,16 @@ def mock_mcp_server():
             if method == "initialized":
                 continue  # No response needed
             
-            if method in responses:
-                response = responses[method].copy()
-                response["id"] = msg_id
-                print(json.dumps(response))
-                sys.stdout.flush()
+            head = static_heads.get(method)
+            if head is not None:
+                out.write(head)
+                out.write(_dumps(msg_id))
+                out.write(b"}\n")
             elif method == "tools/call":
                 result = handle_tool_call(msg)
                 response = {"id": msg_id, "result": result}
-                print(json.dumps(response))
-                sys.stdout.flush()
+                out.write(_dumps(response))
+                out.write(b"\n")
                 
         except json.JSONDecodeError:
             continue
@@ -123,8 +151,14 @@ def mock_mcp_server():
                 "id": msg.get("id"),
                 "error": {"code": -1, "message": str(e)}
             }
-            print(json.dumps(error_response))
-            sys.stdout.flush()
+            out.write(_dumps(error_response))
+            out.write(b"\n")
+        finally:
+            # Flush once per burst rather than once per response
+            if not _stdin_pending():
+                out.flush()
+    
+    out.flush()
 
 
 if __name__ == "__main__":
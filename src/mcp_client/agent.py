@@ -4,17 +4,28 @@ CLI Agent - Interactive command-line interface for MCP Client
 Clean, modern interface with streaming support and rich formatting
 """
 import asyncio
-import json
+import inspect
 import logging
 import os
 import sys
 from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from .client import ChatContext, MCPClient
-from .config import AgentConfig, ConfigManager, get_available_models
-from .llm import LLMMessage
+from .config import AgentConfig
+from .core import to_thread
+
+_STATUS_TMPL = (
+    "🤖 LLM: %s\n"
+    "🌊 MCP Server: %s\n"
+    "🔧 Tools: %d available\n"
+    "💬 Context: %d messages"
+)
+
+
+async def _ainput(prompt: str) -> str:
+    """Read a line without blocking the event loop"""
+    return await to_thread(input, prompt)
 
 
 class CLIAgent:
@@ -33,6 +44,19 @@ class CLIAgent:
         self.client: Optional[MCPClient] = None
         self.context: Optional[ChatContext] = None
         self.session_active = False
+        self._provider_label = f"{config.llm.provider} - {config.llm.model}"
+        # Full input schemas, rendered only on /help <tool>
+        self._schema_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Slash-command table; /exit is handled by the loop itself
+        self._commands = {
+            "help": self._print_help,
+            "status": self._handle_status_command,
+            "tools": self._handle_tools_command,
+            "clear": self._handle_clear_command,
+            "switch": self._handle_switch_command,
+            "debug": self._handle_debug_command,
+        }
 
         # Setup logging
         logging.basicConfig(
@@ -40,6 +64,7 @@ class CLIAgent:
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         )
         self.logger = logging.getLogger("mcp_client.cli")
+        self._debug_on = logging.getLogger().getEffectiveLevel() == logging.DEBUG
 
     @asynccontextmanager
     async def session(self):
@@ -50,6 +75,7 @@ class CLIAgent:
             async with self.client.session():
                 self.session_active = True
                 self.context = ChatContext()
+                self._schema_cache.clear()
                 yield self
         finally:
             self.session_active = False
@@ -62,25 +88,41 @@ class CLIAgent:
 
         try:
             response_parts = []
+            write = sys.stdout.write
+
+            stream = self.client.chat_stream_batched(message, self.context)
+            try:
+                async for batch in stream:
+                    # Coalesce each burst of chunks into a single write
+                    pending = []
+                    for event in batch:
+                        if event["type"] == "chunk":
+                            pending.append(event["content"])
+                            continue
 
-            async for event in self.client.chat_stream(message, self.context):
-                if event["type"] == "chunk":
-                    # Print chunk immediately and collect for return
-                    print(event["content"], end="", flush=True)
-                    response_parts.append(event["content"])
-                elif event["type"] == "tool_notification":
-                    # Show tool notifications to user
-                    print(f"\n{event['content']}")
-                elif event["type"] == "error":
-                    return event["content"]
+                        if pending:
+                            write("".join(pending))
+                            response_parts.extend(pending)
+                            pending = []
+                        if event["type"] == "tool_notification":
+                            # Show tool notifications to user
+                            print(f"\n{event['content']}", flush=True)
+                        elif event["type"] == "error":
+                            return event["content"]
+
+                    if pending:
+                        write("".join(pending))
+                        response_parts.extend(pending)
+                    sys.stdout.flush()
+            finally:
+                # Stops the producer task even when we return early
+                await stream.aclose()
 
             response_text = "".join(response_parts)
 
             # Update context manually since we're using the streaming interface
-            self.context.messages.append(LLMMessage(role="user", content=message))
-            self.context.messages.append(
-                LLMMessage(role="assistant", content=response_text)
-            )
+            self.context.add_message("user", message)
+            self.context.add_message("assistant", response_text)
 
             return response_text
 
@@ -96,23 +138,27 @@ class CLIAgent:
         try:
             stats = await self.client.get_stats()
 
-            status_lines = [
-                f"🤖 LLM: {self.config.llm.provider} - {self.config.llm.model}",
-                f"🌊 MCP Server: {stats.get('server', {}).get('status', 'unknown')}",
-                f"🔧 Tools: {stats.get('tools_cached', 0)} available",
-                f"💬 Context: {len(self.context.messages) if self.context else 0} messages",
-            ]
+            context = self.context
+            status = _STATUS_TMPL % (
+                self._provider_label,
+                stats.get("server", {}).get("status", "unknown"),
+                stats.get("tools_cached", 0),
+                len(context.roles) if context else 0,
+            )
 
-            if self.context and self.context.tool_calls:
-                status_lines.append(
-                    f"⚡ Tool calls: {len(self.context.tool_calls)} executed"
-                )
+            if context and context.tool_calls:
+                status += "\n⚡ Tool calls: %d executed" % len(context.tool_calls)
 
-            return "\n".join(status_lines)
+            return status
 
         except Exception as e:
             return f"❌ Status error: {e}"
 
+    async def _handle_status_command(self):
+        """Handle /status command"""
+        status = await self.get_status()
+        print(f"\n📊 Status:\n{status}\n")
+
     def _print_banner(self):
         """Print welcome banner"""
         print("=" * 60)
@@ -125,6 +171,7 @@ class CLIAgent:
         print()
         print("💡 Commands:")
         print("  /help      - Show this help")
+        print("  /help <tool> - Show a tool's parameters")
         print("  /status    - Show agent status")
         print("  /tools     - List available tools")
         print("  /clear     - Clear conversation history")
@@ -147,6 +194,7 @@ class CLIAgent:
         print()
         print("🎛️  System Commands:")
         print("  /help      - Show this help message")
+        print("  /help <tool> - Show parameters for one tool")
         print("  /status    - Show current agent status")
         print("  /tools     - List all available MCP tools")
         print("  /clear     - Clear conversation history")
@@ -168,7 +216,7 @@ class CLIAgent:
             return
 
         try:
-            tools = await self.client.discover_tools()
+            tools = await self.client.discover_tool_summaries()
 
             if not tools:
                 print("📭 No tools available")
@@ -177,29 +225,55 @@ class CLIAgent:
             print(f"\n🔧 Available Tools ({len(tools)}):")
             print("-" * 40)
 
-            for tool in tools:
-                name = tool["name"]
-                description = tool.get("description", "No description")
-
+            for name, description in tools:
                 print(f"• {name}")
                 print(f"  📝 {description}")
 
-                # Show parameters
-                schema = tool.get("inputSchema", {})
-                properties = schema.get("properties", {})
-
-                if properties:
-                    print(f"  📋 Parameters: {', '.join(properties.keys())}")
-
-                print()
+            print("\n💡 Use /help <tool> for parameter details\n")
 
         except Exception as e:
             print(f"❌ Error listing tools: {e}")
 
+    async def _handle_tool_help(self, name: str):
+        """Handle /help <tool>: fetch and render one tool's schema on demand"""
+        if not self.client:
+            print("❌ Agent not initialized")
+            return
+
+        schema = self._schema_cache.get(name)
+        if schema is None:
+            try:
+                tools = await self.client.discover_tools()
+            except Exception as e:
+                print(f"❌ Error loading tool schema: {e}")
+                return
+
+            tool = next((t for t in tools if t["name"] == name), None)
+            if tool is None:
+                print(f"❌ Tool '{name}' not found. Use /tools to list tools.")
+                return
+            schema = self._schema_cache[name] = tool.get("inputSchema", {})
+
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+
+        print(f"\n🔧 Tool: {name}")
+        if not properties:
+            print("📋 No parameters\n")
+            return
+
+        print("📋 Parameters:")
+        for param, info in properties.items():
+            marker = " (required)" if param in required else ""
+            param_type = info.get("type", "any")
+            description = info.get("description", "No description")
+            print(f"  • {param} ({param_type}){marker}: {description}")
+        print()
+
     def _handle_clear_command(self):
         """Handle /clear command"""
         if self.context:
-            self.context.messages.clear()
+            self.context.clear_messages()
             self.context.tool_calls.clear()
             self.context.tool_results.clear()
             print("🧹 Conversation history cleared")
@@ -208,11 +282,12 @@ class CLIAgent:
 
     def _handle_switch_command(self):
         """Handle /switch command"""
+        from .config import get_available_models
+
         print("\n🔄 Switch LLM Provider")
         print("-" * 25)
 
-        current = f"{self.config.llm.provider} - {self.config.llm.model}"
-        print(f"Current: {current}")
+        print(f"Current: {self._provider_label}")
         print()
 
         print("Available providers:")
@@ -248,14 +323,9 @@ class CLIAgent:
 
     def _handle_debug_command(self):
         """Handle /debug command"""
-        current_level = logging.getLogger().getEffectiveLevel()
-
-        if current_level == logging.DEBUG:
-            logging.getLogger().setLevel(logging.INFO)
-            print("🔧 Debug mode: OFF")
-        else:
-            logging.getLogger().setLevel(logging.DEBUG)
-            print("🔧 Debug mode: ON")
+        self._debug_on = not self._debug_on
+        logging.getLogger().setLevel(logging.DEBUG if self._debug_on else logging.INFO)
+        print(f"🔧 Debug mode: {'ON' if self._debug_on else 'OFF'}")
 
     async def run_interactive(self):
         """Run interactive CLI session"""
@@ -273,7 +343,7 @@ class CLIAgent:
                 while True:
                     try:
                         # Get user input
-                        user_input = input("💬 You: ").strip()
+                        user_input = (await _ainput("💬 You: ")).strip()
 
                         if not user_input:
                             continue
@@ -285,19 +355,14 @@ class CLIAgent:
                             if command == "exit":
                                 print("👋 Goodbye!")
                                 break
-                            elif command == "help":
-                                self._print_help()
-                            elif command == "status":
-                                status = await self.get_status()
-                                print(f"\n📊 Status:\n{status}\n")
-                            elif command == "tools":
-                                await self._handle_tools_command()
-                            elif command == "clear":
-                                self._handle_clear_command()
-                            elif command == "switch":
-                                self._handle_switch_command()
-                            elif command == "debug":
-                                self._handle_debug_command()
+
+                            handler = self._commands.get(command)
+                            if handler is not None:
+                                result = handler()
+                                if inspect.iscoroutine(result):
+                                    await result
+                            elif command.startswith("help "):
+                                await self._handle_tool_help(user_input[6:].strip())
                             else:
                                 print(
                                     f"❓ Unknown command: {command}. Type /help for available commands."
@@ -332,12 +397,16 @@ class CLIAgent:
 
 def create_agent_from_env() -> CLIAgent:
     """Create agent from environment configuration"""
+    from .config import ConfigManager
+
     config = ConfigManager.load_from_env()
     return CLIAgent(config)
 
 
 def create_agent(api_key: str, provider: str = "openai", model: str = None) -> CLIAgent:
     """Create agent with explicit configuration"""
+    from .config import ConfigManager
+
     if provider == "openai":
         config = ConfigManager.create_openai_config(api_key, model or "gpt-4")
     elif provider == "anthropic":
@@ -352,6 +421,11 @@ def create_agent(api_key: str, provider: str = "openai", model: str = None) -> C
 
 async def main():
     """Main CLI entry point"""
+    # Let the stream flush itself on newlines instead of per token
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure:
+        reconfigure(line_buffering=True)
+
     print("🚀 Starting MCP Client CLI...")
 
     # Check for API keys
@@ -4,13 +4,58 @@ Basic MCP Client - Protocol-only interface
 Pure MCP protocol communication without LLM integration
 """
 import asyncio
-import json
+import hashlib
 import logging
 import os
-from typing import Dict, Any, List
+import re
+import sys
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Set
+from urllib.parse import urlparse
 
 from .client import MCPClient
 from .config import MCPConfig
+from .core import to_thread
+from .fastjson import JSONDecodeError, dumps, dumps_bytes, loads
+from .tool_cache import ToolsDiskCache
+
+# Verb and the rest of the line; any whitespace run separates them
+_CMD_RE = re.compile(r"(\S+)\s*(.*)", re.S)
+
+# TCP probe budget before the first HTTP request
+PROBE_TIMEOUT = 0.3
+
+# Results kept for cacheable tools; MCP_CACHE_ALL=1 caches every tool
+RESULT_CACHE_SIZE = 128
+
+
+async def _ainput(prompt: str) -> str:
+    """input() on a worker thread so SSE reads keep running"""
+    return await to_thread(input, prompt)
+
+
+def _parse_kv(s: str) -> Dict[str, str]:
+    """Parse 'key=value key2=value2' in one pass; a bare word makes it a query"""
+    out = {}
+    i, n = 0, len(s)
+    while i < n:
+        while i < n and s[i].isspace():
+            i += 1
+        if i == n:
+            break
+        start = i
+        while i < n and s[i] != "=" and not s[i].isspace():
+            i += 1
+        if i == n or s[i] != "=":
+            out["query"] = s
+            break
+        key = s[start:i]
+        i += 1
+        start = i
+        while i < n and not s[i].isspace():
+            i += 1
+        out[key] = s[start:i]
+    return out
 
 
 class BasicMCPClient:
@@ -27,6 +72,21 @@ class BasicMCPClient:
         self.mcp_url = mcp_url
         self.client = None
         self.tools_cache = []  # Cache for available tools
+        self._tool_names: Set[str] = set()
+        self._tool_by_name: Dict[str, Dict[str, Any]] = {}
+        self._required_by_name: Dict[str, List[str]] = {}
+        self._list_text: Optional[str] = None  # Rendered 'list' output
+        # Opt-in, like AgentConfig.tools_disk_cache for the full client
+        self.disk_cache: Optional[ToolsDiskCache] = (
+            ToolsDiskCache(mcp_url)
+            if os.getenv("MCP_TOOLS_DISK_CACHE", "false").lower() == "true"
+            else None
+        )
+        self.connected = False
+        self._server_version = ""
+        self._keepalive: Optional[asyncio.Future] = None
+        self._result_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._cache_all = os.getenv("MCP_CACHE_ALL") == "1"
         
     async def connect(self):
         """Connect to MCP server"""
@@ -37,27 +97,127 @@ class BasicMCPClient:
         from .transports.sse import SSEMCPClient
         self.client = SSEMCPClient(self.mcp_url)
         
+        # Fail fast when nothing is listening instead of waiting out HTTP timeouts;
+        # a probe that merely times out lets the real request decide
+        probe_error = await self._probe()
+        if probe_error is not None:
+            print(f"❌ Failed to connect: {probe_error}")
+            print(f"💡 Make sure MCP server is running on {self.mcp_url}")
+            return False
+        
         try:
-            health = await self.client.get_health()
-            print(f"✅ Connected to MCP server: {health.get('status', 'unknown')}")
-            
-            # Cache available tools
-            self.tools_cache = await self.client.get_tools()
-            print(f"🔧 Discovered {len(self.tools_cache)} tools")
+            if self.disk_cache is None:
+                # Nothing to consult first: fetch tools alongside the health check
+                health, tools = await asyncio.gather(
+                    self.client.get_health(),
+                    self.client.get_tools(),
+                    return_exceptions=True,
+                )
+                if isinstance(health, BaseException):
+                    raise health
+                print(f"✅ Connected to MCP server: {health.get('status', 'unknown')}")
+                if isinstance(tools, BaseException):
+                    raise tools
+                self._set_tools(tools)
+                print(f"🔧 Discovered {len(self.tools_cache)} tools")
+            else:
+                health = await self.client.get_health()
+                print(f"✅ Connected to MCP server: {health.get('status', 'unknown')}")
+                
+                # The cache is keyed by server version; a warm entry skips tools/list
+                version = self._server_version = str(health.get("version", ""))
+                cached = self.disk_cache.load(version)
+                if cached is not None:
+                    self._set_tools(cached)
+                    print(f"🔧 Discovered {len(self.tools_cache)} tools (cached)")
+                else:
+                    self._set_tools(await self.client.get_tools())
+                    self.disk_cache.store(self.tools_cache, version)
+                    print(f"🔧 Discovered {len(self.tools_cache)} tools")
             
+            self.connected = True
             return True
         except Exception as e:
             print(f"❌ Failed to connect: {e}")
             print(f"💡 Make sure MCP server is running on {self.mcp_url}")
             return False
     
-    async def list_tools(self) -> List[Dict[str, Any]]:
-        """List available tools"""
+    async def _probe(self) -> Optional[OSError]:
+        """TCP-connect to the server; returns the error only if it was refused"""
+        url = urlparse(self.mcp_url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(url.hostname, port), PROBE_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            return None  # Slow network: let the real request decide
+        except OSError as e:
+            return e
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return None
+    
+    def _set_tools(self, tools: List[Dict[str, Any]]):
+        """Replace the tools cache and its name indexes"""
+        self.tools_cache = tools
+        self._tool_names = {t["name"] for t in tools}
+        self._tool_by_name = {t["name"]: t for t in tools}
+        self._required_by_name = {
+            t["name"]: t.get("inputSchema", {}).get("required", []) for t in tools
+        }
+        self._list_text = None
+    
+    def _result_key(self, name: str, arguments: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """Cache key for a call, or None when the tool's results are not cacheable"""
+        if not self._cache_all:
+            tool = self._tool_by_name.get(name)
+            if not tool or not tool.get("cacheable"):
+                return None
+        try:
+            payload = dumps_bytes([name, arguments or {}], sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    def clear_result_cache(self) -> int:
+        """Drop cached tool results; returns how many were removed"""
+        count = len(self._result_cache)
+        self._result_cache.clear()
+        return count
+    
+    def get_tool(self, name: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached tool by name"""
+        return self._tool_by_name.get(name)
+    
+    def render_tool_list(self) -> str:
+        """Tool listing for the 'list' command, rebuilt only when tools change"""
+        if self._list_text is None:
+            lines = [f"\n🔧 Available Tools ({len(self.tools_cache)}):"]
+            lines.extend(
+                f"  • {t['name']}: {t.get('description', 'No description')}"
+                for t in self.tools_cache
+            )
+            lines.append("\n💡 Use 'help <tool>' for detailed parameter info\n")
+            self._list_text = "\n".join(lines)
+        return self._list_text
+    
+    async def list_tools(self, force: bool = False) -> List[Dict[str, Any]]:
+        """List available tools, from cache unless force is set"""
         if not self.client:
             raise RuntimeError("Not connected")
         
+        if not force and self.tools_cache:
+            return self.tools_cache
+        
         try:
             tools = await self.client.get_tools()
+            self._set_tools(tools)
+            if self.disk_cache is not None:
+                self.disk_cache.store(tools, self._server_version)
             return tools
         except Exception as e:
             print(f"❌ Error listing tools: {e}")
@@ -69,12 +229,17 @@ class BasicMCPClient:
             raise RuntimeError("Not connected")
         
         # Validate tool exists first
-        available_tools = [t["name"] for t in self.tools_cache] if hasattr(self, 'tools_cache') else []
-        if available_tools and name not in available_tools:
+        if self._tool_names and name not in self._tool_names:
             print(f"❌ Tool '{name}' not found!")
-            print(f"💡 Available tools: {', '.join(available_tools)}")
+            print(f"💡 Available tools: {', '.join(self._tool_by_name)}")
             return None
         
+        key = self._result_key(name, arguments)
+        if key is not None and key in self._result_cache:
+            self._result_cache.move_to_end(key)
+            print(f"♻️  Cached result for {name}")
+            return self._result_cache[key]
+        
         try:
             print(f"⚡ Calling tool: {name}")
             if arguments:
@@ -110,14 +275,15 @@ class BasicMCPClient:
             if event_count == 0:
                 print("⚠️  No response from tool - it might require specific arguments")
                 # Try to show tool help
-                tool = next((t for t in self.tools_cache if t["name"] == name), None) if hasattr(self, 'tools_cache') else None
-                if tool:
-                    schema = tool.get("inputSchema", {})
-                    required = schema.get("required", [])
-                    if required:
-                        print(f"💡 Required parameters: {', '.join(required)}")
-                        print(f"💡 Example: call {name} {{\"param\": \"value\"}}")
+                required = self._required_by_name.get(name)
+                if required:
+                    print(f"💡 Required parameters: {', '.join(required)}")
+                    print(f"💡 Example: call {name} {{\"param\": \"value\"}}")
             
+            if key is not None and result_data is not None:
+                self._result_cache[key] = result_data
+                if len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
             return result_data
             
         except Exception as e:
@@ -133,8 +299,156 @@ class BasicMCPClient:
     
     async def disconnect(self):
         """Disconnect from server"""
+        if self._keepalive:
+            self._keepalive.cancel()
+            self._keepalive = None
         if self.client:
             await self.client.disconnect()
+        self.connected = False
+
+    async def __aenter__(self) -> "BasicMCPClient":
+        """Connect and keep one HTTP session for the whole block"""
+        if await self.connect():
+            # Input is read off-loop, so pings keep running while the user types
+            self._keepalive = asyncio.ensure_future(self.client.ping_loop())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.disconnect()
+
+
+class _CLIState:
+    """Mutable state shared by the basic CLI command handlers"""
+    
+    def __init__(self):
+        self.running = True
+        self.root_logger = logging.getLogger()
+        self.debug_on = self.root_logger.getEffectiveLevel() == logging.DEBUG
+
+
+async def _handle_exit(rest: str, client: BasicMCPClient, state: _CLIState):
+    print("👋 Goodbye!")
+    state.running = False
+
+
+async def _handle_list(rest: str, client: BasicMCPClient, state: _CLIState):
+    # Served from tools_cache; 'refresh' is the only command that re-fetches
+    sys.stdout.write(client.render_tool_list() + "\n")
+    sys.stdout.flush()
+
+
+async def _handle_refresh(rest: str, client: BasicMCPClient, state: _CLIState):
+    tools = await client.list_tools(force=True)
+    print(f"🔄 Refreshed: {len(tools)} tools available")
+
+
+async def _handle_call(rest: str, client: BasicMCPClient, state: _CLIState):
+    # Parse tool call
+    parts = rest.split(maxsplit=1)
+    if not parts:
+        print("💡 Usage: call <tool> [args]")
+        return
+    tool_name = parts[0]
+    
+    arguments = {}
+    if len(parts) > 1:
+        args_str = parts[1]
+        # split() left no leading space: the first byte picks the parser
+        if args_str[0] == "{":
+            try:
+                arguments = loads(args_str)
+            except JSONDecodeError:
+                print("❌ Invalid JSON arguments")
+                return
+        else:
+            arguments = _parse_kv(args_str)
+    
+    try:
+        result = await client.call_tool(tool_name, arguments)
+        print(f"✅ Tool result:")
+        
+        # Pretty print result
+        if isinstance(result, dict) and "content" in result:
+            content = result["content"]
+            for item in content:
+                if isinstance(item, dict) and "text" in item:
+                    print(f"  {item['text']}")
+                else:
+                    print(f"  {item}")
+        else:
+            print(f"  {result}")
+        
+    except Exception as e:
+        print(f"❌ Error: {e}")
+
+
+async def _handle_help(rest: str, client: BasicMCPClient, state: _CLIState):
+    tool_name = rest.strip()
+    if not tool_name:
+        print("💡 Usage: help <tool>")
+        return
+    # Find tool and show details
+    tool = client.get_tool(tool_name)
+    if not tool:
+        print(f"❌ Tool '{tool_name}' not found")
+        print(f"💡 Available: {', '.join(client._tool_by_name)}")
+        return
+    
+    schema = tool.get("inputSchema", {})
+    properties = schema.get("properties", {})
+    required = schema.get("required", [])
+    
+    # Build the whole help page and emit it with a single write
+    out = [
+        f"\n🔧 Tool: {tool['name']}",
+        f"📝 Description: {tool.get('description', 'No description')}",
+    ]
+    if properties:
+        out.append("\n📋 Parameters:")
+        for param, info in properties.items():
+            param_type = info.get("type", "any")
+            description = info.get("description", "No description")
+            required_marker = " (required)" if param in required else ""
+            out.append(f"  • {param} ({param_type}){required_marker}: {description}")
+        
+        out.append("\n💡 Usage examples:")
+        if required:
+            example_args = {req: f"<{req}_value>" for req in required[:2]}
+            out.append(f"  call {tool_name} {dumps(example_args)}")
+        else:
+            out.append(f"  call {tool_name}  # No parameters required")
+            first_param = next(iter(properties))
+            out.append(f"  call {tool_name} {{\"{first_param}\": \"example_value\"}}")
+    else:
+        out.append("\n📋 No parameters required")
+    out.append("\n")
+    sys.stdout.write("\n".join(out))
+    sys.stdout.flush()
+
+
+async def _handle_cache(rest: str, client: BasicMCPClient, state: _CLIState):
+    if rest.strip() != "clear":
+        print("💡 Usage: cache clear")
+        return
+    print(f"🧹 Cleared {client.clear_result_cache()} cached results")
+
+
+async def _handle_debug(rest: str, client: BasicMCPClient, state: _CLIState):
+    state.debug_on = not state.debug_on
+    state.root_logger.setLevel(logging.DEBUG if state.debug_on else logging.WARNING)
+    print(f"🔧 Debug mode: {'ON' if state.debug_on else 'OFF'}")
+
+
+# Basic CLI verbs, keyed on the first word of the command line
+DISPATCH = {
+    "exit": _handle_exit,
+    "list": _handle_list,
+    "refresh": _handle_refresh,
+    "call": _handle_call,
+    "help": _handle_help,
+    "cache": _handle_cache,
+    "debug": _handle_debug,
+}
 
 
 async def run_basic_cli():
@@ -145,24 +459,22 @@ async def run_basic_cli():
     print("You can discover and execute tools directly.\n")
     
     mcp_url = os.getenv("MCP_BASE_URL", "http://localhost:8081")
-    client = BasicMCPClient(mcp_url)
-    
-    try:
-        # Connect to server
-        connected = await client.connect()
-        if not connected:
+    async with BasicMCPClient(mcp_url) as client:
+        if not client.connected:
             return
         
-        # List available tools
-        tools = await client.list_tools()
+        # List the tools connect() already discovered
+        tools = client.tools_cache
         print(f"\n🔧 Available Tools ({len(tools)}):")
         for i, tool in enumerate(tools, 1):
             print(f"  {i}. {tool['name']}: {tool.get('description', 'No description')}")
         
         print(f"\n📋 Enhanced Commands:")
-        print(f"  list                    - List available tools with parameter info")
+        print(f"  list                    - List available tools (names and descriptions)")
+        print(f"  refresh                 - Re-fetch the tool list from the server")
         print(f"  call <tool> [args]      - Call a tool with validation")
         print(f"  help <tool>             - Show detailed tool help and parameters")
+        print(f"  cache clear             - Forget cached tool results")
         print(f"  debug                   - Toggle debug mode")
         print(f"  exit                    - Exit client")
         print(f"\n💡 Tool Call Examples:")
@@ -172,135 +484,22 @@ async def run_basic_cli():
         print()
         
         # Interactive loop
-        while True:
+        state = _CLIState()
+        while state.running:
             try:
-                command = input("mcp> ").strip()
+                command = (await _ainput("mcp> ")).strip()
                 
                 if not command:
                     continue
-                    
-                if command == "exit":
-                    print("👋 Goodbye!")
-                    break
-                    
-                elif command == "list":
-                    tools = await client.list_tools()
-                    print(f"\n🔧 Available Tools ({len(tools)}):")
-                    for tool in tools:
-                        name = tool["name"] 
-                        desc = tool.get("description", "No description")
-                        print(f"  • {name}: {desc}")
-                        
-                        # Show parameter summary
-                        schema = tool.get("inputSchema", {})
-                        properties = schema.get("properties", {})
-                        required = schema.get("required", [])
-                        
-                        if properties:
-                            param_summary = []
-                            for param in properties.keys():
-                                marker = "*" if param in required else ""
-                                param_summary.append(f"{param}{marker}")
-                            print(f"    📋 Parameters: {', '.join(param_summary)}")
-                            if required:
-                                print(f"    ⚠️  * = required")
-                        else:
-                            print(f"    📋 No parameters")
-                    print(f"\n💡 Use 'help <tool>' for detailed parameter info")
-                    print()
                 
-                elif command.startswith("call "):
-                    # Parse tool call
-                    parts = command[5:].strip().split(maxsplit=1)
-                    tool_name = parts[0]
-                    
-                    arguments = {}
-                    if len(parts) > 1:
-                        args_str = parts[1]
-                        try:
-                            # Try to parse as JSON
-                            if args_str.startswith("{"):
-                                arguments = json.loads(args_str)
-                            else:
-                                # Simple key=value parsing
-                                for pair in args_str.split():
-                                    if "=" in pair:
-                                        key, value = pair.split("=", 1)
-                                        arguments[key] = value
-                                    else:
-                                        arguments["query"] = args_str
-                                        break
-                        except json.JSONDecodeError:
-                            print("❌ Invalid JSON arguments")
-                            continue
-                    
-                    try:
-                        result = await client.call_tool(tool_name, arguments)
-                        print(f"✅ Tool result:")
-                        
-                        # Pretty print result
-                        if isinstance(result, dict) and "content" in result:
-                            content = result["content"]
-                            for item in content:
-                                if isinstance(item, dict) and "text" in item:
-                                    print(f"  {item['text']}")
-                                else:
-                                    print(f"  {item}")
-                        else:
-                            print(f"  {result}")
-                        
-                    except Exception as e:
-                        print(f"❌ Error: {e}")
-                
-                elif command.startswith("help "):
-                    tool_name = command[5:].strip()
-                    # Find tool and show details
-                    tool = next((t for t in tools if t["name"] == tool_name), None)
-                    if tool:
-                        print(f"\n🔧 Tool: {tool['name']}")
-                        print(f"📝 Description: {tool.get('description', 'No description')}")
-                        
-                        schema = tool.get("inputSchema", {})
-                        properties = schema.get("properties", {})
-                        required = schema.get("required", [])
-                        
-                        if properties:
-                            print(f"\n📋 Parameters:")
-                            for param, info in properties.items():
-                                param_type = info.get("type", "any")
-                                description = info.get("description", "No description")
-                                required_marker = " (required)" if param in required else ""
-                                print(f"  • {param} ({param_type}){required_marker}: {description}")
-                            
-                            print(f"\n💡 Usage examples:")
-                            if required:
-                                example_args = {req: f"<{req}_value>" for req in required[:2]}
-                                print(f"  call {tool_name} {json.dumps(example_args)}")
-                            else:
-                                print(f"  call {tool_name}  # No parameters required")
-                                if properties:
-                                    first_param = list(properties.keys())[0]
-                                    print(f"  call {tool_name} {{\"{first_param}\": \"example_value\"}}")
-                        else:
-                            print(f"\n📋 No parameters required")
-                        print()
-                    else:
-                        print(f"❌ Tool '{tool_name}' not found")
-                        available = [t["name"] for t in tools]
-                        print(f"💡 Available: {', '.join(available)}")
-                
-                elif command == "debug":
-                    current_level = logging.getLogger().getEffectiveLevel()
-                    if current_level == logging.DEBUG:
-                        logging.getLogger().setLevel(logging.WARNING)
-                        print("🔧 Debug mode: OFF")
-                    else:
-                        logging.getLogger().setLevel(logging.DEBUG)
-                        print("🔧 Debug mode: ON")
-                
-                else:
+                verb, rest = _CMD_RE.match(command).groups()
+                handler = DISPATCH.get(verb)
+                if handler is None:
                     print(f"❓ Unknown command: {command}")
                     print(f"💡 Type 'list' to see tools, 'call <tool>' to execute, 'exit' to quit")
+                    continue
+                
+                await handler(rest, client, state)
                     
             except KeyboardInterrupt:
                 print("\n👋 Goodbye!")
@@ -310,10 +509,6 @@ async def run_basic_cli():
                 break
             except Exception as e:
                 print(f"❌ Error: {e}")
-    
-    finally:
-        await client.disconnect()
-
 
 async def main():
     """Main entry point for basic MCP client"""
@@ -23,11 +23,25 @@ from typing import Optional
 
 import click
 
-from .agent import main as agent_runner
-from .basic_client import main as basic_client_runner  # True basic MCP client
-from .cli_agent import create_agent, create_agent_from_env
-from .cli_agent import main as enhanced_main
-from .config import get_available_models
+# Runners are imported inside the commands that use them, so `doctor` and
+# `models` never load the LLM/agent stack.
+
+
+def _run(main_coro) -> None:
+    """Run an entry-point coroutine, on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if sys.version_info >= (3, 11):
+        loop_factory = uvloop.new_event_loop if uvloop else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main_coro)
+    else:
+        if uvloop:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(main_coro)
 
 
 @click.command()
@@ -79,11 +93,15 @@ def main(
 
     # Route to appropriate interface
     if basic:
+        from .basic_client import main as basic_client_runner  # True basic MCP client
+
         print("🔧 Starting Basic MCP Client (Protocol Only)")
-        asyncio.run(basic_client_runner())
+        _run(basic_client_runner())
     else:
+        from .cli_agent import main as enhanced_main
+
         print("🧠 Starting MCP Client with LLM Integration")
-        asyncio.run(enhanced_main())
+        _run(enhanced_main())
 
 
 @click.command()
@@ -92,6 +110,8 @@ def main(
 )
 def list_models(provider: str):
     """List available models for a provider"""
+    from .config import get_available_models
+
     models = get_available_models(provider)
 
     print(f"\\n📋 Available {provider.title()} Models:")
@@ -164,13 +184,23 @@ cli.add_command(doctor, name="doctor")
 # Create specific entry points for different use cases
 def agent_main():
     """Entry point for MCP agent functionality"""
+    from .cli_agent import main as enhanced_main
+
     print("🤖 Starting MCP Agent (LLM-Enhanced)")
-    asyncio.run(enhanced_main())
+    _run(enhanced_main())
 
 def basic_client_main():
     """Entry point for basic MCP client"""
+    from .basic_client import main as basic_client_runner
+
     print("🔧 Starting Basic MCP Client (Protocol Only)")
-    asyncio.run(basic_client_runner())
+    _run(basic_client_runner())
+
+def enhanced_client_main():
+    """Entry point for enhanced basic MCP client"""
+    from .enhanced_basic_client import main as enhanced_client_runner
+
+    _run(enhanced_client_runner())
 
 # Make main the default when called directly
 if __name__ == "__main__":
@@ -6,20 +6,48 @@ Unified, high-level client that combines LLM capabilities with MCP tool executio
 in a clean, streaming-enabled interface.
 """
 import asyncio
-import json
 import logging
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from functools import lru_cache
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, List, Optional, Tuple
 
 from .config import AgentConfig, ConfigManager, LLMConfig, MCPConfig
+from .core import DATACLASS_SLOTS, to_thread
 from .exceptions import MCPClientError, MCPConnectionError, MCPToolError
+from .fastjson import dumps_bytes, loads
 from .llm import LLMClient, LLMClientFactory, LLMMessage
+from .tool_cache import ToolsDiskCache
 from .transport import SSETransport
 
+_SYSTEM_MESSAGE = LLMMessage(
+    role="system",
+    content=(
+        "You are a helpful assistant with access to tools. "
+        "Use the available tools when needed to help the user. "
+        "When you receive tool results, format them nicely for the user."
+    ),
+)
 
-@dataclass
+_STREAM_END = object()
+
+
+def _async_chunks(stream: Any) -> AsyncIterator[str]:
+    """Return an async iterator over LLM stream chunks, never blocking the loop"""
+    if hasattr(stream, "__aiter__"):
+        return stream
+    return _threaded_chunks(iter(stream))
+
+
+async def _threaded_chunks(it: Any) -> AsyncIterator[str]:
+    """Drain a sync chunk iterator, pulling each item on a worker thread"""
+    while True:
+        chunk = await to_thread(next, it, _STREAM_END)
+        if chunk is _STREAM_END:
+            return
+        yield chunk
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ToolCall:
     """Represents a tool call request"""
 
@@ -28,7 +56,7 @@ class ToolCall:
     reasoning: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolResult:
     """Represents a tool execution result"""
 
@@ -39,15 +67,60 @@ class ToolResult:
     duration: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChatContext:
-    """Chat conversation context"""
+    """
+    Chat conversation context
+
+    History is stored column-wise in ``roles``/``contents``; ``messages``
+    builds LLMMessage objects only when a request is sent, and
+    ``request_messages`` reuses the ones built for earlier turns.
+
+    ``add_message()`` and ``clear_messages()`` are the write path for the
+    history; ``messages`` is a read-only tuple snapshot.
+    """
 
-    messages: List[LLMMessage] = field(default_factory=list)
+    roles: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
     available_tools: List[Dict[str, Any]] = field(default_factory=list)
     tool_calls: List[ToolCall] = field(default_factory=list)
     tool_results: List[ToolResult] = field(default_factory=list)
     session_id: str = ""
+    _wire: List[LLMMessage] = field(default_factory=list, init=False, repr=False)
+
+    @property
+    def messages(self) -> Tuple[LLMMessage, ...]:
+        """Conversation history as LLM messages (a snapshot; use add_message to write)"""
+        return tuple(
+            LLMMessage(role=role, content=content)
+            for role, content in zip(self.roles, self.contents)
+        )
+
+    def request_messages(self, system: LLMMessage) -> List[LLMMessage]:
+        """Fresh [system, *history] list; only turns not yet cached are built"""
+        roles, contents, wire = self.roles, self.contents, self._wire
+        # Reuse the cached prefix still backed by the same column entries, so
+        # trimmed or rewritten history is rebuilt rather than resent stale
+        keep = 0
+        for message, role, content in zip(wire, roles, contents):
+            if message.role is not role or message.content is not content:
+                break
+            keep += 1
+        del wire[keep:]
+        for i in range(keep, len(roles)):
+            wire.append(LLMMessage(role=roles[i], content=contents[i]))
+        return [system, *wire]
+
+    def add_message(self, role: str, content: str) -> None:
+        """Append one turn to the history"""
+        self.roles.append(role)
+        self.contents.append(content)
+
+    def clear_messages(self) -> None:
+        """Drop the conversation history"""
+        self.roles.clear()
+        self.contents.clear()
+        self._wire.clear()
 
 
 class MCPClient:
@@ -61,14 +134,25 @@ class MCPClient:
     - Connection management
     """
 
-    def __init__(self, config: AgentConfig):
+    def __init__(self, config: AgentConfig, tools_cache_ttl: float = 300.0):
         self.config = config
         self.llm_client: Optional[LLMClient] = None
         self.transport: Optional[SSETransport] = None
         self.logger = logging.getLogger("mcp_client.client")
+        self._session_depth = 0  # Open session() blocks sharing the clients
 
         # Tool caching
         self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._openai_tools_cache: Optional[List[Dict[str, Any]]] = None
+        # The converted list's source is held, so identity checks stay valid
+        self._openai_tools_source: Optional[List[Dict[str, Any]]] = None
+        self._openai_tools_source_len = 0
+        self._tools_disk_cache: Optional[ToolsDiskCache] = (
+            ToolsDiskCache(config.mcp.base_url, ttl=tools_cache_ttl)
+            if config.tools_disk_cache
+            else None
+        )
+        self._server_version: Optional[str] = None  # Keys the disk cache
 
     @classmethod
     def create_openai(
@@ -101,35 +185,65 @@ class MCPClient:
         config = ConfigManager.load_from_env()
         return cls(config)
 
+    def _ensure_clients(self) -> None:
+        """Create the LLM client and transport once; both keep their HTTP pools"""
+        if self.llm_client is None:
+            self.llm_client = LLMClientFactory.create_client(self.config.llm)
+        if self.transport is None:
+            self.transport = SSETransport(
+                self.config.mcp.base_url,
+                timeout=self.config.mcp.timeout,
+                reconnect_delay=self.config.mcp.reconnect_delay,
+            )
+
     @asynccontextmanager
     async def session(self):
-        """Context manager for client session"""
-        # Initialize LLM client
-        self.llm_client = LLMClientFactory.create_client(self.config.llm)
-
-        # Initialize transport
-        self.transport = SSETransport(
-            self.config.mcp.base_url,
-            timeout=self.config.mcp.timeout,
-            reconnect_delay=self.config.mcp.reconnect_delay,
-        )
+        """
+        Context manager for client session
+
+        Nested sessions share the LLM client and transport (and their pooled
+        connections); both are closed when the outermost session exits.
+        """
+        self._ensure_clients()
+        self._session_depth += 1
 
         try:
-            # Test MCP connection
-            health = await self.transport.get_health()
-            self.logger.info(f"🌊 Connected to MCP server: {health.get('status')}")
+            # Test MCP connection while tool discovery runs; a discovery
+            # failure is already logged and is retried on first use
+            if self._tools_disk_cache is None:
+                health, _ = await asyncio.gather(
+                    self.transport.get_health(),
+                    self.discover_tools(),
+                    return_exceptions=True,
+                )
+                if isinstance(health, BaseException):
+                    raise health
+            else:
+                # The disk cache is keyed by server version, so learn it first
+                health = await self.transport.get_health()
+                self._server_version = str(health.get("version", ""))
+                try:
+                    await self.discover_tools()
+                except MCPToolError:
+                    pass
+            self.logger.info("🌊 Connected to MCP server: %s", health.get("status"))
             yield self
         except Exception as e:
             self.logger.error(f"❌ MCP connection failed: {e}")
             raise MCPConnectionError(f"Failed to connect to MCP server: {e}")
         finally:
-            # Cleanup
-            if self.transport:
-                await self.transport.disconnect()
-            if self.llm_client:
-                await self.llm_client.close()
-            self.transport = None
-            self.llm_client = None
+            self._session_depth -= 1
+            if self._session_depth == 0:
+                await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the LLM client and transport"""
+        if self.transport:
+            await self.transport.disconnect()
+        if self.llm_client:
+            await self.llm_client.close()
+        self.transport = None
+        self.llm_client = None
 
     async def discover_tools(self) -> List[Dict[str, Any]]:
         """Discover available tools from MCP server"""
@@ -141,25 +255,54 @@ class MCPClient:
                 "Client not initialized. Use 'async with client.session():'"
             )
 
+        # Only used once session() has learned the server version
+        disk_cache = (
+            self._tools_disk_cache if self._server_version is not None else None
+        )
+        if disk_cache is not None:
+            tools = disk_cache.load(self._server_version)
+            if tools is not None:
+                self._tools_cache = tools
+                self._get_openai_tools(tools)
+                self.logger.debug("📦 Loaded %d tools from disk cache", len(tools))
+                return tools
+
         try:
             tools = await self.transport.get_tools()
             self._tools_cache = tools
-            self.logger.info(
-                f"🔧 Discovered {len(tools)} tools: {[t['name'] for t in tools]}"
-            )
+            self._get_openai_tools(tools)
+            if disk_cache is not None:
+                disk_cache.store(tools, self._server_version)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "🔧 Discovered %d tools: %s", len(tools), [t["name"] for t in tools]
+                )
             return tools
         except Exception as e:
             self.logger.error(f"❌ Tool discovery failed: {e}")
             raise MCPToolError(f"Tool discovery failed: {e}")
 
-    @lru_cache(maxsize=1)
-    def _convert_mcp_tools_to_openai(self, tools_tuple: tuple) -> List[Dict[str, Any]]:
+    def invalidate_tools_cache(self) -> None:
+        """Drop cached tools from memory and disk"""
+        self._tools_cache = None
+        self._openai_tools_cache = None
+        self._openai_tools_source = None
+        if self._tools_disk_cache is not None and self._server_version is not None:
+            self._tools_disk_cache.invalidate(self._server_version)
+
+    async def discover_tool_summaries(self) -> List[Tuple[str, str]]:
+        """Discover tools as (name, description) pairs, without input schemas"""
+        tools = await self.discover_tools()
+        return [(t["name"], t.get("description", "No description")) for t in tools]
+
+    @staticmethod
+    def _convert_mcp_tools_to_openai(
+        tools: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """Convert MCP tools to OpenAI function format"""
         openai_tools = []
 
-        for tool_json in tools_tuple:
-            tool = json.loads(tool_json)
-
+        for tool in tools:
             openai_tool = {
                 "type": "function",
                 "function": {
@@ -179,8 +322,9 @@ class MCPClient:
         if not self.transport:
             raise MCPClientError("Transport not initialized")
 
-        self.logger.info(f"⚡ Executing tool: {tool_call.name}")
-        start_time = asyncio.get_event_loop().time()
+        self.logger.info("⚡ Executing tool: %s", tool_call.name)
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
 
         try:
             # Execute tool via streaming transport
@@ -203,14 +347,14 @@ class MCPClient:
                         tool_call.arguments,
                     )
 
-            duration = asyncio.get_event_loop().time() - start_time
+            duration = loop.time() - start_time
 
             return ToolResult(
                 name=tool_call.name, success=True, result=result_data, duration=duration
             )
 
         except Exception as e:
-            duration = asyncio.get_event_loop().time() - start_time
+            duration = loop.time() - start_time
             self.logger.error(f"❌ Tool execution failed: {e}")
 
             return ToolResult(
@@ -221,6 +365,29 @@ class MCPClient:
                 duration=duration,
             )
 
+    def _get_openai_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return OpenAI-format tools, reconverting only when the list changes"""
+        if (
+            self._openai_tools_cache is None
+            or self._openai_tools_source is not tools
+            or self._openai_tools_source_len != len(tools)
+        ):
+            self._openai_tools_cache = self._convert_mcp_tools_to_openai(tools)
+            self._openai_tools_source = tools
+            self._openai_tools_source_len = len(tools)
+        return self._openai_tools_cache
+
+    def _format_tool_result(self, result: Any) -> str:
+        """Serialize a tool result compactly, truncated to max_tool_result_bytes"""
+        data = dumps_bytes(result)
+        limit = self.config.max_tool_result_bytes
+        if len(data) <= limit:
+            return data.decode()
+        return (
+            data[:limit].decode(errors="ignore")
+            + f"... [truncated {len(data) - limit} bytes]"
+        )
+
     async def chat_stream(
         self, message: str, context: Optional[ChatContext] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
@@ -242,65 +409,59 @@ class MCPClient:
         if not self.llm_client:
             raise MCPClientError("LLM client not initialized")
 
-        # Convert tools to OpenAI format
-        tools_tuple = tuple(
-            json.dumps(tool, sort_keys=True) for tool in context.available_tools
-        )
-        openai_tools = self._convert_mcp_tools_to_openai(tools_tuple)
-
-        # Build messages
-        system_prompt = (
-            "You are a helpful assistant with access to tools. "
-            "Use the available tools when needed to help the user. "
-            "When you receive tool results, format them nicely for the user."
-        )
+        # Precomputed by discover_tools; converted here only for foreign lists
+        openai_tools = self._get_openai_tools(context.available_tools)
 
-        messages = [LLMMessage(role="system", content=system_prompt)]
-        messages.extend(context.messages)
+        # Per-turn request list; the caller records the turn via add_message()
+        messages = context.request_messages(_SYSTEM_MESSAGE)
         messages.append(LLMMessage(role="user", content=message))
 
         try:
-            # Check if LLM wants to use tools
-            initial_response = await self.llm_client.complete(
-                messages, tools=openai_tools if openai_tools else None, temperature=0.3
+            # Check if LLM wants to use tools; without any it never can
+            initial_response = (
+                await self.llm_client.complete(
+                    messages, tools=openai_tools, temperature=0.3
+                )
+                if openai_tools
+                else None
             )
 
-            if initial_response.tool_calls:
-                # Execute tools with notifications
+            if initial_response is not None and initial_response.tool_calls:
+                # Notify up front, then run the independent calls concurrently
+                parsed = []
                 for tool_call in initial_response.tool_calls:
                     func_name = tool_call["function"]["name"]
-                    func_args = json.loads(tool_call["function"]["arguments"])
+                    func_args = loads(tool_call["function"]["arguments"])
+                    parsed.append(
+                        (tool_call, ToolCall(name=func_name, arguments=func_args))
+                    )
 
-                    # Notify user
                     yield {
                         "type": "tool_notification",
                         "content": f"🔍 Using {func_name} tool...",
                     }
 
-                    # Execute tool
-                    result = await self.execute_tool(
-                        ToolCall(name=func_name, arguments=func_args)
+                results = await asyncio.gather(
+                    *(self.execute_tool(call) for _, call in parsed)
+                )
+
+                # Add to conversation in the order the LLM requested
+                messages.append(
+                    LLMMessage(
+                        role="assistant",
+                        content=initial_response.content or "",
+                        tool_calls=initial_response.tool_calls,
                     )
+                )
 
+                for (tool_call, call), result in zip(parsed, results):
                     # Store in context
-                    context.tool_calls.append(
-                        ToolCall(name=func_name, arguments=func_args)
-                    )
+                    context.tool_calls.append(call)
                     context.tool_results.append(result)
 
-                    # Add to conversation
-                    if not messages or messages[-1].role != "assistant":
-                        messages.append(
-                            LLMMessage(
-                                role="assistant",
-                                content=initial_response.content or "",
-                                tool_calls=initial_response.tool_calls,
-                            )
-                        )
-
                     # Add tool result
                     tool_result_content = (
-                        json.dumps(result.result, indent=2)
+                        self._format_tool_result(result.result)
                         if result.success
                         else f"Error: {result.error}"
                     )
@@ -308,7 +469,7 @@ class MCPClient:
                         LLMMessage(
                             role="tool",
                             content=tool_result_content,
-                            name=func_name,
+                            name=call.name,
                             tool_call_id=tool_call["id"],
                         )
                     )
@@ -319,15 +480,17 @@ class MCPClient:
                     "content": "✅ Tools completed, generating response...",
                 }
 
-                async for chunk in self.llm_client.stream(messages):
+                async for chunk in _async_chunks(self.llm_client.stream(messages)):
                     yield {"type": "chunk", "content": chunk}
 
             else:
                 # No tools needed - stream immediately
-                async for chunk in self.llm_client.stream(
-                    messages,
-                    tools=openai_tools if openai_tools else None,
-                    temperature=0.3,
+                async for chunk in _async_chunks(
+                    self.llm_client.stream(
+                        messages,
+                        tools=openai_tools if openai_tools else None,
+                        temperature=0.3,
+                    )
                 ):
                     yield {"type": "chunk", "content": chunk}
 
@@ -335,6 +498,44 @@ class MCPClient:
             self.logger.error(f"❌ Chat stream error: {e}")
             yield {"type": "error", "content": f"❌ Error: {e}"}
 
+    async def chat_stream_batched(
+        self, message: str, context: Optional[ChatContext] = None
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """
+        Stream chat events in bursts
+
+        A producer task feeds chat_stream() into a queue; each yielded list
+        holds every event that was ready when the consumer resumed.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def produce():
+            try:
+                async for event in self.chat_stream(message, context):
+                    queue.put_nowait(event)
+            finally:
+                queue.put_nowait(done)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                finished = batch[-1] is done
+                if finished:
+                    batch.pop()
+                if batch:
+                    yield batch
+                if finished:
+                    break
+            # Surface producer exceptions
+            await producer
+        finally:
+            producer.cancel()
+
     async def chat(
         self, message: str, context: Optional[ChatContext] = None
     ) -> Tuple[str, ChatContext]:
@@ -347,22 +548,29 @@ class MCPClient:
         if context is None:
             context = ChatContext()
 
-        response_parts = []
+        response_parts: List[str] = []
+        append = response_parts.append
+        info = self.logger.info
 
-        async for event in self.chat_stream(message, context):
-            if event["type"] == "chunk":
-                response_parts.append(event["content"])
-            elif event["type"] == "tool_notification":
-                # Log but don't include in response
-                self.logger.info(event["content"])
-            elif event["type"] == "error":
-                return event["content"], context
+        stream = self.chat_stream(message, context)
+        try:
+            async for event in stream:
+                kind = event["type"]
+                if kind == "chunk":
+                    append(event["content"])
+                elif kind == "tool_notification":
+                    # Log but don't include in response
+                    info(event["content"])
+                elif kind == "error":
+                    return event["content"], context
+        finally:
+            await stream.aclose()
 
         response_text = "".join(response_parts)
 
         # Update context
-        context.messages.append(LLMMessage(role="user", content=message))
-        context.messages.append(LLMMessage(role="assistant", content=response_text))
+        context.add_message("user", message)
+        context.add_message("assistant", response_text)
 
         return response_text, context
 
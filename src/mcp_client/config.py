@@ -4,9 +4,9 @@ Configuration Management for MCP Client
 Supports OpenAI and Anthropic with environment-based configuration
 """
 import os
+import threading
 from dataclasses import dataclass, field
-from functools import lru_cache
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from .exceptions import MCPConfigurationError
 
@@ -46,15 +46,64 @@ class AgentConfig:
     mcp: MCPConfig = field(default_factory=MCPConfig)
     debug: bool = False
     log_level: str = "INFO"
+    max_tool_result_bytes: int = 32768
+    tools_disk_cache: bool = False  # Persist discovered tools under $XDG_CACHE_HOME
+
+
+# Every environment variable load_from_env() reads
+_ENV_KEYS = (
+    "LLM_PROVIDER",
+    "OPENAI_API_KEY",
+    "OPENAI_MODEL",
+    "OPENAI_BASE_URL",
+    "ANTHROPIC_API_KEY",
+    "ANTHROPIC_MODEL",
+    "ANTHROPIC_BASE_URL",
+    "LLM_TEMPERATURE",
+    "LLM_MAX_TOKENS",
+    "MCP_BASE_URL",
+    "MCP_TIMEOUT",
+    "MCP_RECONNECT_DELAY",
+    "DEBUG",
+    "LOG_LEVEL",
+    "MAX_TOOL_RESULT_BYTES",
+    "MCP_TOOLS_DISK_CACHE",
+)
 
 
 class ConfigManager:
     """Environment-based configuration management"""
 
-    @staticmethod
-    @lru_cache(maxsize=1)
-    def load_from_env() -> AgentConfig:
+    # (env snapshot, config) from the last load; rebuilt when any var changes
+    _env_cache: Optional[Tuple[Tuple[Optional[str], ...], AgentConfig]] = None
+    _env_lock = threading.Lock()
+
+    @classmethod
+    def load_from_env(cls) -> AgentConfig:
         """Load configuration from environment variables"""
+        snapshot = tuple(os.environ.get(key) for key in _ENV_KEYS)
+        cached = cls._env_cache
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+
+        with cls._env_lock:
+            cached = cls._env_cache
+            if cached is not None and cached[0] == snapshot:
+                return cached[1]
+            config = cls._build_from_env()
+            cls._env_cache = (snapshot, config)
+        return config
+
+    @classmethod
+    def reload_from_env(cls) -> AgentConfig:
+        """Drop the cached configuration and rebuild it from the environment"""
+        with cls._env_lock:
+            cls._env_cache = None
+        return cls.load_from_env()
+
+    @staticmethod
+    def _build_from_env() -> AgentConfig:
+        """Build configuration from the current environment"""
 
         # LLM Configuration
         provider = os.getenv("LLM_PROVIDER", "openai").lower()
@@ -97,6 +146,9 @@ class ConfigManager:
             mcp=mcp_config,
             debug=os.getenv("DEBUG", "false").lower() == "true",
             log_level=os.getenv("LOG_LEVEL", "INFO"),
+            max_tool_result_bytes=int(os.getenv("MAX_TOOL_RESULT_BYTES", "32768")),
+            tools_disk_cache=os.getenv("MCP_TOOLS_DISK_CACHE", "false").lower()
+            == "true",
         )
 
     @staticmethod
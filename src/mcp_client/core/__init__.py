@@ -4,9 +4,22 @@ Core MCP Client Components
 Foundation classes and protocols following Búvár architecture patterns.
 Provides base abstractions for dependency injection and plugin systems.
 """
+import asyncio
+import sys
+from collections import ChainMap
 from typing import Protocol, runtime_checkable, Any, Dict, Optional
 from abc import ABC, abstractmethod
 
+# dataclass(**DATACLASS_SLOTS) gives slotted instances where supported (3.10+)
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+if sys.version_info >= (3, 9):
+    to_thread = asyncio.to_thread
+else:
+    async def to_thread(func, *args):
+        """asyncio.to_thread stand-in for 3.8: run func(*args) on the default executor"""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
 @runtime_checkable
 class MCPTransport(Protocol):
     """Transport protocol for dependency injection"""
@@ -27,22 +40,40 @@ class LLMProvider(Protocol):
 class ContextRegistry:
     """Hierarchical context management following Búvár patterns"""
     
+    # Bumped by every set_parent(); chains built under an older value are stale
+    _generation = 0
+    
     def __init__(self):
         self._contexts: Dict[str, Any] = {}
         self._parent: Optional['ContextRegistry'] = None
+        # Own contexts first, then each ancestor's; one lookup walks the chain
+        self._chain: ChainMap = ChainMap(self._contexts)
+        self._chain_generation = ContextRegistry._generation
     
     def set_parent(self, parent: 'ContextRegistry') -> None:
         self._parent = parent
+        ContextRegistry._generation += 1
+    
+    def _lookup_chain(self) -> ChainMap:
+        """ChainMap over this registry and its ancestors as they are linked now"""
+        if self._chain_generation != ContextRegistry._generation:
+            maps = []
+            node: Optional['ContextRegistry'] = self
+            while node is not None:
+                maps.append(node._contexts)
+                node = node._parent
+            self._chain = ChainMap(*maps)
+            self._chain_generation = ContextRegistry._generation
+        return self._chain
     
     def register(self, name: str, value: Any) -> None:
         self._contexts[name] = value
     
     def resolve(self, name: str) -> Any:
-        if name in self._contexts:
-            return self._contexts[name]
-        if self._parent:
-            return self._parent.resolve(name)
-        raise KeyError(f"Context '{name}' not found")
+        try:
+            return self._lookup_chain()[name]
+        except KeyError:
+            raise KeyError(f"Context '{name}' not found") from None
     
     def create_child(self) -> 'ContextRegistry':
         child = ContextRegistry()
@@ -57,4 +88,6 @@ __all__ = [
     "LLMProvider", 
     "ContextRegistry",
     "global_context",
+    "DATACLASS_SLOTS",
+    "to_thread",
 ]
@@ -8,28 +8,64 @@ Builds on the stdio transport for actual MCP server communication.
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from mcp_client.transport import MCPMessage, StdioTransport
+from mcp_client.core import DATACLASS_SLOTS
+from mcp_client.fastjson import dumps_bytes, dumps_pretty
+from mcp_client.transports.stdio import MCPMessage, StdioTransport
+
+_INIT_PARAMS: Dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {"tools": {}},  # We want to use tools
+    "clientInfo": {"name": "mcp-python-client", "version": "1.0.0"},
+}
+_TOOLS_LIST_PARAMS: Dict[str, Any] = {}
+
+
+def _frame_head(method: str, params: Dict[str, Any]) -> bytes:
+    """Serialize a request once, leaving it open for the id"""
+    return dumps_bytes({"method": method, "params": params})[:-1] + b',"id":'
+
+
+# Handshake frames never change, so only the id is formatted per connection
+_INIT_FRAME_HEAD = _frame_head("initialize", _INIT_PARAMS)
+_TOOLS_LIST_FRAME_HEAD = _frame_head("tools/list", _TOOLS_LIST_PARAMS)
+_INITIALIZED_FRAME = MCPMessage("initialized", {}).to_bytes()
+
+
+def _frame(head: bytes, msg_id: int) -> bytes:
+    """Close a pre-serialized request head with its id"""
+    return head + str(msg_id).encode() + b"}\n"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MCPTool:
     """Represents an available MCP tool"""
 
     name: str
     description: str
     input_schema: Dict[str, Any]
+    # Rendered once at discovery for help output
+    schema_pretty: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self.schema_pretty = dumps_pretty(self.input_schema)
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class MCPClient:
     """Main MCP client with protocol handling"""
 
     transport: StdioTransport
     tools: List[MCPTool] = field(default_factory=list)
+    tools_by_name: Dict[str, MCPTool] = field(default_factory=dict)
     server_info: Dict[str, Any] = field(default_factory=dict)
-    _pending_requests: Dict[str, asyncio.Future] = field(default_factory=dict)
+    _pending_requests: Dict[int, asyncio.Future] = field(default_factory=dict)
+    _response_task: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(
+        default=None, init=False, repr=False
+    )
+    _completed: int = field(default=0, init=False, repr=False)
 
     async def initialize(self) -> bool:
         """Perform MCP handshake and discover capabilities"""
@@ -44,24 +80,21 @@ class MCPClient:
             logging.error(f"Initialization failed: {e}")
             return False
 
-    async def _send_initialize(self) -> None:
-        """Send MCP initialize request"""
+    def _new_request(self) -> Tuple[int, asyncio.Future]:
+        """Allocate a request id and register its response future"""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
         msg_id = self.transport.next_id()
-        init_msg = MCPMessage(
-            method="initialize",
-            params={
-                "protocolVersion": "2024-11-05",
-                "capabilities": {"tools": {}},  # We want to use tools
-                "clientInfo": {"name": "mcp-python-client", "version": "1.0.0"},
-            },
-            id=msg_id,
-        )
+        future = self._loop.create_future()
+        self._pending_requests[msg_id] = future
+        return msg_id, future
 
+    async def _send_initialize(self) -> None:
+        """Send MCP initialize request"""
         # Set up future for response
-        future = asyncio.Future()
-        self._pending_requests[msg_id] = future
+        msg_id, future = self._new_request()
 
-        await self.transport.send_message(init_msg)
+        await self.transport.send_frame(_frame(_INIT_FRAME_HEAD, msg_id))
 
         # Wait for initialize response
         result = await future
@@ -69,17 +102,13 @@ class MCPClient:
         logging.info(f"Server initialized: {self.server_info}")
 
         # Send initialized notification
-        await self.transport.send_message(MCPMessage("initialized", {}))
+        await self.transport.send_frame(_INITIALIZED_FRAME)
 
     async def _discover_tools(self) -> None:
         """Discover available tools from server"""
-        msg_id = self.transport.next_id()
-        tools_msg = MCPMessage("tools/list", {}, msg_id)
+        msg_id, future = self._new_request()
 
-        future = asyncio.Future()
-        self._pending_requests[msg_id] = future
-
-        await self.transport.send_message(tools_msg)
+        await self.transport.send_frame(_frame(_TOOLS_LIST_FRAME_HEAD, msg_id))
         result = await future
 
         # Parse tools
@@ -92,6 +121,7 @@ class MCPClient:
             )
             for tool in tools_data
         ]
+        self.tools_by_name = {tool.name: tool for tool in self.tools}
 
         logging.info(
             f"Discovered {len(self.tools)} tools: {[t.name for t in self.tools]}"
@@ -101,40 +131,66 @@ class MCPClient:
         self, tool_name: str, arguments: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Execute a tool on the MCP server"""
-        msg_id = self.transport.next_id()
+        msg_id, future = self._new_request()
         call_msg = MCPMessage(
             method="tools/call",
             params={"name": tool_name, "arguments": arguments},
             id=msg_id,
         )
 
-        future = asyncio.Future()
-        self._pending_requests[msg_id] = future
-
         await self.transport.send_message(call_msg)
         result = await future
 
         return result.get("result", {})
 
+    async def call_tools(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Execute several tools with a single write; results keep call order"""
+        frames = []
+        futures = []
+        for tool_name, arguments in calls:
+            msg_id, future = self._new_request()
+            frames.append(
+                MCPMessage(
+                    method="tools/call",
+                    params={"name": tool_name, "arguments": arguments},
+                    id=msg_id,
+                ).to_bytes()
+            )
+            futures.append(future)
+
+        # Responses are matched by id, so they may arrive in any order
+        await self.transport.send_frame(b"".join(frames))
+        results = await asyncio.gather(*futures)
+
+        return [result.get("result", {}) for result in results]
+
     async def _handle_responses(self) -> None:
         """Background task to handle ongoing server responses"""
         async for message in self.transport.read_messages():
-            msg_id = message.get("id")
-            if msg_id and msg_id in self._pending_requests:
-                future = self._pending_requests.pop(msg_id)
-                if "error" in message:
-                    future.set_exception(Exception(f"MCP Error: {message['error']}"))
-                else:
-                    future.set_result(message)
+            future = self._pending_requests.pop(message.get("id"), None)
+            if future is None:
+                continue
+
+            # Dicts never shrink on pop; swap in a fresh one when idle
+            self._completed += 1
+            if not self._completed & 0xFFF and not self._pending_requests:
+                self._pending_requests = {}
+
+            if "error" in message:
+                future.set_exception(Exception(f"MCP Error: {message['error']}"))
+            else:
+                future.set_result(message)
 
     async def start_response_handler(self) -> None:
         """Start background response handling (already started in initialize)"""
-        if not hasattr(self, "_response_task"):
+        if self._response_task is None:
             self._response_task = asyncio.create_task(self._handle_responses())
 
     async def close(self) -> None:
         """Close MCP client connection"""
-        if hasattr(self, "_response_task"):
+        if self._response_task is not None:
             self._response_task.cancel()
             try:
                 await self._response_task
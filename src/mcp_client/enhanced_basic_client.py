@@ -13,12 +13,153 @@ import asyncio
 import json
 import logging
 import os
+import re
+import sys
 import traceback
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
 from functools import wraps
 
 from .client import MCPClient
 from .config import MCPConfig
+from .core import DATACLASS_SLOTS, to_thread
+from .fastjson import JSONDecodeError, dumps_pretty, loads
+
+# Seconds between background health pings; commands themselves never probe
+KEEPALIVE_INTERVAL = 30.0
+
+# Minimum seconds between progress lines (20 Hz) unless the percentage moves
+PROGRESS_INTERVAL = 0.05
+
+# Failures that mean the server is unreachable rather than the call being bad
+_CONNECTION_ERRORS = (OSError, asyncio.TimeoutError)
+
+# Error event the SSE transport emits once it gives up reconnecting
+_MAX_RECONNECTS_ERROR = "Max reconnection attempts reached"
+
+
+def _is_transport_error(data: Dict[str, Any]) -> bool:
+    """True for error events raised by the SSE transport itself, not the tool"""
+    return "reconnect_attempt" in data or data.get("error") == _MAX_RECONNECTS_ERROR
+
+
+@dataclass(**DATACLASS_SLOTS)
+class ToolPlan:
+    """Schema facts and rendered help for one tool, built when tools are cached"""
+    properties: Dict[str, Any]
+    required: FrozenSet[str]
+    required_list: Tuple[str, ...]
+    param_hint: str  # Shown when a tool with parameters is called bare
+    help_text: str  # Full 'help <tool>' output
+
+
+def _build_plan(tool: Dict[str, Any]) -> ToolPlan:
+    """Digest a tool's inputSchema once"""
+    name = tool["name"]
+    schema = tool.get("inputSchema", {})
+    properties = schema.get("properties", {})
+    required = schema.get("required", [])
+    
+    hint = [f"💡 Tool '{name}' accepts parameters:"]
+    for param, info in properties.items():
+        param_type = info.get("type", "unknown")
+        description = info.get("description", "No description")
+        required_marker = " (required)" if param in required else ""
+        hint.append(f"   • {param} ({param_type}){required_marker}: {description}")
+    hint.append(f"💡 Example: call {name} {{\"param\": \"value\"}}")
+    
+    lines = [
+        f"\\n🔧 Tool: {name}",
+        f"📝 Description: {tool.get('description', 'No description')}",
+    ]
+    if schema:
+        lines.append(f"\\n📋 Input Schema:")
+        if properties:
+            lines.append(f"Parameters:")
+            for param, info in properties.items():
+                param_type = info.get("type", "any")
+                description = info.get("description", "No description")
+                required_marker = " (required)" if param in required else ""
+                lines.append(f"  • {param} ({param_type}){required_marker}")
+                lines.append(f"    {description}")
+            
+            lines.append(f"\\n💡 Example usage:")
+            if required:
+                example_args = {req: f"<{req}_value>" for req in required[:2]}
+                lines.append(f"  call {name} {json.dumps(example_args)}")
+            else:
+                lines.append(f"  call {name}")
+        else:
+            lines.append(f"  No parameters required")
+    lines.append("")
+    
+    return ToolPlan(
+        properties=properties,
+        required=frozenset(required),
+        required_list=tuple(required),
+        param_hint="\n".join(hint) + "\n",
+        help_text="\n".join(lines) + "\n",
+    )
+
+
+def _render_overview(tools: List[Dict[str, Any]]) -> str:
+    """Numbered tool summary shown once after connecting"""
+    lines = [f"\\n🔧 Available Tools ({len(tools)}):"]
+    for i, tool in enumerate(tools, 1):
+        lines.append(f"  {i}. {tool['name']}: {tool.get('description', 'No description')}")
+        
+        # Show if tool has required parameters
+        required = tool.get("inputSchema", {}).get("required", [])
+        if required:
+            lines.append(f"     ⚠️  Requires: {', '.join(required)}")
+    return "\n".join(lines) + "\n"
+
+
+def _render_list(tools: List[Dict[str, Any]]) -> str:
+    """Tool listing with parameter details for the 'list' command"""
+    lines = [f"\\n🔧 Available Tools ({len(tools)}):"]
+    for tool in tools:
+        lines.append(f"  • {tool['name']}: {tool.get('description', 'No description')}")
+        
+        # Show parameter details
+        schema = tool.get("inputSchema", {})
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        
+        if properties:
+            params = []
+            for param, info in properties.items():
+                param_type = info.get("type", "any")
+                required_marker = "*" if param in required else ""
+                params.append(f"{param}({param_type}){required_marker}")
+            lines.append(f"    📋 Parameters: {', '.join(params)}")
+            lines.append(f"    💡 * = required")
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+# key=value tokens; the value runs to the next whitespace and may contain '='
+_KV_RE = re.compile(r"([^\s=]*)=(\S*)")
+
+_BOOL = {"true": True, "false": False}
+
+# The accepted number shapes: plain digits, or digits with one decimal point
+_INT_RE = re.compile(r"\d+")
+_FLOAT_RE = re.compile(r"\d+\.\d*|\.\d+")
+
+
+def _coerce(value: str) -> Any:
+    """Intelligent type conversion for a key=value argument"""
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if _FLOAT_RE.fullmatch(value):
+        return float(value)
+    return _BOOL.get(value.lower(), value)
+
+
+async def _ainput(prompt: str) -> str:
+    """input() on a worker thread so the keepalive and SSE reads keep running"""
+    return await to_thread(input, prompt)
 
 
 def async_error_handler(func):
@@ -56,16 +197,25 @@ class EnhancedBasicMCPClient:
         self.mcp_url = mcp_url
         self.client = None
         self.tools_cache: List[Dict[str, Any]] = []
+        self._tools_by_name: Dict[str, Dict[str, Any]] = {}
+        self._tool_names_tuple: Tuple[str, ...] = ()
+        self._plans: Dict[str, ToolPlan] = {}
+        self._negative: Set[str] = set()  # Names already reported missing
+        self._validation_memo: Set[Tuple[str, FrozenSet]] = set()  # Passed shapes
+        self._overview_banner = ""  # Rendered post-connect tool summary
+        self._list_banner = ""  # Rendered 'list' output
         self.connection_healthy = False
         self.logger = logging.getLogger("basic_mcp_client")
+        self._keepalive: Optional[asyncio.Future] = None
         
     @async_error_handler
     async def connect(self) -> bool:
         """Connect to MCP server with enhanced diagnostics"""
         try:
-            # Create SSE client
-            from .transports.sse import SSEMCPClient
-            self.client = SSEMCPClient(self.mcp_url)
+            # Create the SSE client once; reconnects reuse its pooled session
+            if self.client is None:
+                from .transports.sse import SSEMCPClient
+                self.client = SSEMCPClient(self.mcp_url)
             
             print(f"🔌 Connecting to {self.mcp_url}...")
             
@@ -81,6 +231,9 @@ class EnhancedBasicMCPClient:
             # Cache available tools
             await self._refresh_tools_cache()
             
+            if self._keepalive is None:
+                self._keepalive = asyncio.ensure_future(self._keepalive_loop())
+            
             return True
             
         except asyncio.TimeoutError:
@@ -99,11 +252,32 @@ class EnhancedBasicMCPClient:
             return
             
         try:
-            self.tools_cache = await self.client.get_tools()
+            self._set_tools(await self.client.get_tools())
             print(f"🔧 Discovered {len(self.tools_cache)} tools")
         except Exception as e:
             self.logger.warning(f"Failed to refresh tools cache: {e}")
-            self.tools_cache = []
+            self._set_tools([])
+            if isinstance(e, _CONNECTION_ERRORS):
+                self.connection_healthy = False
+    
+    def _set_tools(self, tools: List[Dict[str, Any]]):
+        """Replace the tools cache and its name index"""
+        self.tools_cache = tools
+        self._tools_by_name = {t["name"]: t for t in tools}
+        self._tool_names_tuple = tuple(self._tools_by_name)
+        self._plans = {t["name"]: _build_plan(t) for t in tools}
+        self._negative.clear()
+        self._validation_memo.clear()
+        self._overview_banner = _render_overview(tools)
+        self._list_banner = _render_list(tools)
+    
+    def get_tool(self, name: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached tool by name"""
+        return self._tools_by_name.get(name)
+    
+    def get_plan(self, name: str) -> Optional[ToolPlan]:
+        """Look up a cached tool's validation/help plan by name"""
+        return self._plans.get(name)
     
     async def list_tools(self) -> List[Dict[str, Any]]:
         """List available tools with enhanced information"""
@@ -117,37 +291,41 @@ class EnhancedBasicMCPClient:
     
     def _validate_tool_exists(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Validate tool exists and return its metadata"""
-        tool = next((t for t in self.tools_cache if t["name"] == tool_name), None)
+        tool = self._tools_by_name.get(tool_name)
         if not tool:
-            available = [t["name"] for t in self.tools_cache]
             print(f"❌ Tool '{tool_name}' not found!")
-            print(f"💡 Available tools: {', '.join(available) if available else 'None'}")
+            # The full list is shown once per misspelling until tools change
+            if tool_name not in self._negative:
+                self._negative.add(tool_name)
+                available = self._tool_names_tuple
+                print(f"💡 Available tools: {', '.join(available) if available else 'None'}")
             return None
         return tool
     
     def _validate_tool_arguments(self, tool: Dict[str, Any], arguments: Dict[str, Any]) -> bool:
-        """Validate tool arguments against schema"""
-        schema = tool.get("inputSchema", {})
-        properties = schema.get("properties", {})
-        required = schema.get("required", [])
+        """Validate tool arguments against the tool's precomputed plan"""
+        try:
+            key = (tool["name"], frozenset(arguments.items()))
+        except TypeError:  # Unhashable argument values; validate uncached
+            key = None
+        if key is not None and key in self._validation_memo:
+            return True
+        
+        plan = self._plans[tool["name"]]
         
         # Check required parameters
-        missing_required = [req for req in required if req not in arguments]
-        if missing_required:
+        if not plan.required <= arguments.keys():
+            missing_required = [req for req in plan.required_list if req not in arguments]
             print(f"❌ Missing required parameters: {', '.join(missing_required)}")
             return False
         
         # Show parameter info if no arguments provided but parameters exist
-        if not arguments and properties:
-            print(f"💡 Tool '{tool['name']}' accepts parameters:")
-            for param, info in properties.items():
-                param_type = info.get("type", "unknown")
-                description = info.get("description", "No description")
-                required_marker = " (required)" if param in required else ""
-                print(f"   • {param} ({param_type}){required_marker}: {description}")
-            print(f"💡 Example: call {tool['name']} {{\"param\": \"value\"}}")
-            return len(required) == 0  # Only proceed if no required params
+        if not arguments and plan.properties:
+            sys.stdout.write(plan.param_hint)
         
+        # Only passes are remembered, so rejections always explain themselves
+        if key is not None:
+            self._validation_memo.add(key)
         return True
     
     @async_error_handler
@@ -168,44 +346,72 @@ class EnhancedBasicMCPClient:
         
         print(f"⚡ Calling tool: {name}")
         if arguments:
-            print(f"📝 Arguments: {json.dumps(arguments, indent=2)}")
+            print(f"📝 Arguments: {dumps_pretty(arguments)}")
         
         try:
             result_data = None
             event_count = 0
             
-            async for event in self.client.stream_tool(name, arguments):
-                event_count += 1
-                event_type = event.get("event")
-                data = event.get("data", {})
-                
-                self.logger.debug(f"📨 Event {event_count}: {event_type} | {data}")
-                
-                if event_type == "started":
-                    print(f"🚀 Tool execution started")
-                elif event_type == "progress":
-                    message = data.get("message", "Processing...")
-                    progress = data.get("progress")
-                    if progress is not None:
-                        print(f"📈 Progress: {message} ({progress}%)")
+            finished = False
+            write = sys.stdout.write
+            clock = asyncio.get_running_loop().time
+            last_progress_at = float("-inf")
+            last_percent = None
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            
+            # One resumption per socket read, however many events it carried
+            async for batch in self.client.stream_tool_batch(name, arguments):
+                for event in batch:
+                    event_count += 1
+                    event_type = event.get("event")
+                    data = event.get("data", {})
+                    
+                    if debug:
+                        self.logger.debug("📨 Event %d: %s | %s", event_count, event_type, data)
+                    
+                    if event_type == "started":
+                        print(f"🚀 Tool execution started")
+                    elif event_type == "progress":
+                        # Coalesce bursts of ticks into at most 20 lines/s
+                        progress = data.get("progress")
+                        suffix = "%"
+                        try:
+                            percent = int(float(progress)) if progress is not None else None
+                        except (TypeError, ValueError):
+                            # Non-numeric values ("50%") are printed and compared raw
+                            percent, suffix = progress, ""
+                        now = clock()
+                        if now - last_progress_at < PROGRESS_INTERVAL and percent == last_percent:
+                            continue
+                        last_progress_at, last_percent = now, percent
+                        message = data.get("message", "Processing...")
+                        if progress is not None:
+                            write(f"📈 Progress: {message} ({progress}{suffix})\n")
+                        else:
+                            write(f"📈 Progress: {message}\n")
+                    elif event_type == "result":
+                        result_data = data.get("result", data)
+                        print(f"📄 Result received")
+                        finished = True
+                        break
+                    elif event_type == "completed":
+                        duration = data.get("duration", 0)
+                        print(f"🏁 Completed in {duration:.3f}s")
+                        finished = True
+                        break
+                    elif event_type == "error":
+                        error_msg = data.get("error", "Unknown error")
+                        error_code = data.get("code", "UNKNOWN")
+                        print(f"❌ Tool error [{error_code}]: {error_msg}")
+                        if _is_transport_error(data):
+                            # The stream itself broke; let the CLI reconnect
+                            self.connection_healthy = False
+                        raise Exception(f"Tool error: {error_msg}")
                     else:
-                        print(f"📈 Progress: {message}")
-                elif event_type == "result":
-                    result_data = data.get("result", data)
-                    print(f"📄 Result received")
+                        # Handle unexpected event types
+                        print(f"📨 Event: {event_type} | {data}")
+                if finished:
                     break
-                elif event_type == "completed":
-                    duration = data.get("duration", 0)
-                    print(f"🏁 Completed in {duration:.3f}s")
-                    break
-                elif event_type == "error":
-                    error_msg = data.get("error", "Unknown error")
-                    error_code = data.get("code", "UNKNOWN")
-                    print(f"❌ Tool error [{error_code}]: {error_msg}")
-                    raise Exception(f"Tool error: {error_msg}")
-                else:
-                    # Handle unexpected event types
-                    print(f"📨 Event: {event_type} | {data}")
             
             if event_count == 0:
                 print("⚠️  No events received from tool execution")
@@ -239,8 +445,17 @@ class EnhancedBasicMCPClient:
             self.connection_healthy = False
             return False
     
+    async def _keepalive_loop(self) -> None:
+        """Refresh connection_healthy in the background every KEEPALIVE_INTERVAL"""
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            await self.check_connection_health()
+    
     async def disconnect(self):
         """Disconnect from server"""
+        if self._keepalive:
+            self._keepalive.cancel()
+            self._keepalive = None
         if self.client:
             try:
                 await self.client.disconnect()
@@ -252,6 +467,143 @@ class EnhancedBasicMCPClient:
                 self.connection_healthy = False
 
 
+class _CLIState:
+    """Mutable state shared by the enhanced CLI command handlers"""
+    
+    def __init__(self):
+        self.running = True
+
+
+async def _handle_exit(rest: str, client: EnhancedBasicMCPClient, state: _CLIState):
+    print("👋 Goodbye!")
+    state.running = False
+
+
+async def _handle_list(rest: str, client: EnhancedBasicMCPClient, state: _CLIState):
+    await client.list_tools()  # Refetches only if the cache is empty
+    sys.stdout.write(client._list_banner)
+
+
+async def _handle_call(rest: str, client: EnhancedBasicMCPClient, state: _CLIState):
+    # Parse tool call with enhanced validation
+    parts = rest.split(maxsplit=1)
+    if not parts:
+        print("💡 Usage: call <tool> [args]")
+        return
+    tool_name = parts[0]
+    
+    arguments = {}
+    if len(parts) > 1:
+        args_str = parts[1]
+        try:
+            # Try to parse as JSON
+            if args_str.startswith("{"):
+                arguments = loads(args_str)
+            else:
+                # Enhanced key=value parsing, one regex scan
+                if "=" in args_str:
+                    arguments = {
+                        m.group(1): _coerce(m.group(2))
+                        for m in _KV_RE.finditer(args_str)
+                    }
+                else:
+                    # Treat as single query parameter
+                    arguments = {"query": args_str}
+                    
+        except JSONDecodeError as e:
+            print(f"❌ Invalid JSON arguments: {e}")
+            print(f"💡 Use JSON format: {{\\\"key\\\": \\\"value\\\"}}")
+            print(f"💡 Or key=value format: key=value key2=value2")
+            return
+    
+    # Execute tool with validation
+    try:
+        result = await client.call_tool(tool_name, arguments)
+        
+        if result is not None:
+            print(f"✅ Tool result:")
+            
+            # Enhanced result formatting; large texts are written as-is, not
+            # concatenated into a second copy first
+            write = sys.stdout.write
+            if isinstance(result, dict) and "content" in result:
+                content = result["content"]
+                for item in content:
+                    if isinstance(item, dict) and "text" in item:
+                        write("  📄 ")
+                        write(str(item["text"]))
+                        write("\n")
+                    else:
+                        print(f"  📊 {item}")
+            elif isinstance(result, dict):
+                write(dumps_pretty(result))
+                write("\n")
+            else:
+                print(f"  {result}")
+        
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        print(f"💡 Use 'help {tool_name}' for parameter details")
+
+
+async def _handle_help(rest: str, client: EnhancedBasicMCPClient, state: _CLIState):
+    tool_name = rest.strip()
+    if not tool_name:
+        print("💡 Usage: help <tool>")
+        return
+    plan = client.get_plan(tool_name)
+    if plan:
+        sys.stdout.write(plan.help_text)
+    else:
+        print(f"❌ Tool '{tool_name}' not found")
+        print(f"💡 Available: {', '.join(client._tool_names_tuple)}")
+
+
+async def _handle_health(rest: str, client: EnhancedBasicMCPClient, state: _CLIState):
+    healthy = await client.check_connection_health()
+    status = "✅ Healthy" if healthy else "❌ Unhealthy"
+    print(f"🏥 Connection health: {status}")
+
+
+async def _handle_debug(rest: str, client: EnhancedBasicMCPClient, state: _CLIState):
+    current_level = logging.getLogger().getEffectiveLevel()
+    if current_level == logging.DEBUG:
+        logging.getLogger().setLevel(logging.WARNING)
+        print("🔧 Debug mode: OFF")
+    else:
+        logging.getLogger().setLevel(logging.DEBUG)
+        print("🔧 Debug mode: ON")
+
+
+# Enhanced CLI verbs, keyed on the first word of the command line
+DISPATCH = {
+    "exit": _handle_exit,
+    "list": _handle_list,
+    "call": _handle_call,
+    "help": _handle_help,
+    "health": _handle_health,
+    "debug": _handle_debug,
+}
+
+
+# Command summary printed once after connecting
+_COMMANDS_HELP = "\n".join([
+    "\\n📋 Enhanced Commands:",
+    "  list                    - List available tools with details",
+    "  call <tool> [args]      - Call a tool with validation",
+    "  help <tool>             - Show detailed tool help",
+    "  health                  - Check connection health",
+    "  debug                   - Toggle debug mode",
+    "  exit                    - Exit client",
+    "\\n💡 Examples:",
+    '  call echo {\\"text\\": \\"Hello World!\\"}',
+    '  call opensearch {\\"query\\": \\"example search\\"}',
+    "  help opensearch",
+    "",
+    "",
+])
+
+
 async def run_enhanced_cli():
     """Run enhanced MCP CLI interface with comprehensive diagnostics"""
     print("🔧 Enhanced Basic MCP Client - Protocol Only")
@@ -279,188 +631,35 @@ async def run_enhanced_cli():
             return
         
         # List available tools
-        tools = await client.list_tools()
-        print(f"\\n🔧 Available Tools ({len(tools)}):")
-        for i, tool in enumerate(tools, 1):
-            name = tool["name"]
-            desc = tool.get("description", "No description")
-            print(f"  {i}. {name}: {desc}")
-            
-            # Show if tool has required parameters
-            schema = tool.get("inputSchema", {})
-            required = schema.get("required", [])
-            if required:
-                print(f"     ⚠️  Requires: {', '.join(required)}")
+        # connect() already cached the tools and rendered their overview
+        sys.stdout.write(client._overview_banner)
         
-        print(f"\\n📋 Enhanced Commands:")
-        print(f"  list                    - List available tools with details")
-        print(f"  call <tool> [args]      - Call a tool with validation")
-        print(f"  help <tool>             - Show detailed tool help")
-        print(f"  health                  - Check connection health")
-        print(f"  debug                   - Toggle debug mode")
-        print(f"  exit                    - Exit client")
-        print(f"\\n💡 Examples:")
-        print(f"  call echo {{\\\"text\\\": \\\"Hello World!\\\"}}")
-        print(f"  call opensearch {{\\\"query\\\": \\\"example search\\\"}}")
-        print(f"  help opensearch")
-        print()
+        sys.stdout.write(_COMMANDS_HELP)
         
         # Interactive loop
-        while True:
+        state = _CLIState()
+        while state.running:
             try:
-                # Check connection health periodically
-                if not await client.check_connection_health():
+                # Health is tracked passively by failed calls and the keepalive
+                if not client.connection_healthy:
                     print("⚠️  Connection lost! Attempting to reconnect...")
                     if not await client.connect():
                         print("❌ Failed to reconnect. Exiting...")
                         break
                 
-                command = input("mcp> ").strip()
+                command = (await _ainput("mcp> ")).strip()
                 
                 if not command:
                     continue
                     
-                if command == "exit":
-                    print("👋 Goodbye!")
-                    break
-                    
-                elif command == "list":
-                    tools = await client.list_tools()
-                    print(f"\\n🔧 Available Tools ({len(tools)}):")
-                    for tool in tools:
-                        name = tool["name"] 
-                        desc = tool.get("description", "No description")
-                        print(f"  • {name}: {desc}")
-                        
-                        # Show parameter details
-                        schema = tool.get("inputSchema", {})
-                        properties = schema.get("properties", {})
-                        required = schema.get("required", [])
-                        
-                        if properties:
-                            params = []
-                            for param, info in properties.items():
-                                param_type = info.get("type", "any")
-                                required_marker = "*" if param in required else ""
-                                params.append(f"{param}({param_type}){required_marker}")
-                            print(f"    📋 Parameters: {', '.join(params)}")
-                            print(f"    💡 * = required")
-                    print()
-                
-                elif command.startswith("call "):
-                    # Parse tool call with enhanced validation
-                    parts = command[5:].strip().split(maxsplit=1)
-                    tool_name = parts[0]
-                    
-                    arguments = {}
-                    if len(parts) > 1:
-                        args_str = parts[1]
-                        try:
-                            # Try to parse as JSON
-                            if args_str.startswith("{"):
-                                arguments = json.loads(args_str)
-                            else:
-                                # Enhanced key=value parsing
-                                if "=" in args_str:
-                                    for pair in args_str.split():
-                                        if "=" in pair:
-                                            key, value = pair.split("=", 1)
-                                            # Intelligent type conversion
-                                            if value.isdigit():
-                                                arguments[key] = int(value)
-                                            elif value.replace(".", "").isdigit():
-                                                arguments[key] = float(value)
-                                            elif value.lower() in ["true", "false"]:
-                                                arguments[key] = value.lower() == "true"
-                                            else:
-                                                arguments[key] = value
-                                else:
-                                    # Treat as single query parameter
-                                    arguments = {"query": args_str}
-                                    
-                        except json.JSONDecodeError as e:
-                            print(f"❌ Invalid JSON arguments: {e}")
-                            print(f"💡 Use JSON format: {{\\\"key\\\": \\\"value\\\"}}")
-                            print(f"💡 Or key=value format: key=value key2=value2")
-                            continue
-                    
-                    # Execute tool with validation
-                    try:
-                        result = await client.call_tool(tool_name, arguments)
-                        
-                        if result is not None:
-                            print(f"✅ Tool result:")
-                            
-                            # Enhanced result formatting
-                            if isinstance(result, dict) and "content" in result:
-                                content = result["content"]
-                                for item in content:
-                                    if isinstance(item, dict) and "text" in item:
-                                        print(f"  📄 {item['text']}")
-                                    else:
-                                        print(f"  📊 {item}")
-                            elif isinstance(result, dict):
-                                print(json.dumps(result, indent=2))
-                            else:
-                                print(f"  {result}")
-                        
-                    except Exception as e:
-                        print(f"❌ Error: {e}")
-                        print(f"💡 Use 'help {tool_name}' for parameter details")
-                
-                elif command.startswith("help "):
-                    tool_name = command[5:].strip()
-                    tool = next((t for t in tools if t["name"] == tool_name), None)
-                    if tool:
-                        print(f"\\n🔧 Tool: {tool['name']}")
-                        print(f"📝 Description: {tool.get('description', 'No description')}")
-                        
-                        schema = tool.get("inputSchema", {})
-                        if schema:
-                            print(f"\\n📋 Input Schema:")
-                            properties = schema.get("properties", {})
-                            required = schema.get("required", [])
-                            
-                            if properties:
-                                print(f"Parameters:")
-                                for param, info in properties.items():
-                                    param_type = info.get("type", "any")
-                                    description = info.get("description", "No description")
-                                    required_marker = " (required)" if param in required else ""
-                                    print(f"  • {param} ({param_type}){required_marker}")
-                                    print(f"    {description}")
-                                
-                                print(f"\\n💡 Example usage:")
-                                if required:
-                                    example_args = {req: f"<{req}_value>" for req in required[:2]}
-                                    print(f"  call {tool_name} {json.dumps(example_args)}")
-                                else:
-                                    print(f"  call {tool_name}")
-                            else:
-                                print(f"  No parameters required")
-                        print()
-                    else:
-                        print(f"❌ Tool '{tool_name}' not found")
-                        available = [t["name"] for t in tools]
-                        print(f"💡 Available: {', '.join(available)}")
-                
-                elif command == "health":
-                    healthy = await client.check_connection_health()
-                    status = "✅ Healthy" if healthy else "❌ Unhealthy"
-                    print(f"🏥 Connection health: {status}")
-                    
-                elif command == "debug":
-                    current_level = logging.getLogger().getEffectiveLevel()
-                    if current_level == logging.DEBUG:
-                        logging.getLogger().setLevel(logging.WARNING)
-                        print("🔧 Debug mode: OFF")
-                    else:
-                        logging.getLogger().setLevel(logging.DEBUG)
-                        print("🔧 Debug mode: ON")
-                        
-                else:
+                verb, _, rest = command.partition(" ")
+                handler = DISPATCH.get(verb)
+                if handler is None:
                     print(f"❓ Unknown command: {command}")
                     print(f"💡 Type 'list' to see tools, 'call <tool>' to execute, 'exit' to quit")
+                    continue
+                
+                await handler(rest, client, state)
                     
             except KeyboardInterrupt:
                 print("\\n👋 Goodbye!")
@@ -486,4 +685,5 @@ if __name__ == "__main__":
     # Set default logging level (can be overridden with DEBUG env var)
     log_level = logging.DEBUG if os.getenv("DEBUG") else logging.WARNING
     logging.basicConfig(level=log_level)
-    asyncio.run(main())
+    from .cli import _run
+    _run(main())
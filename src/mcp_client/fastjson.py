@@ -0,0 +1,67 @@
+"""
+Fast JSON helpers for MCP wire traffic
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+catching the stdlib exception type.
+"""
+import json
+from json import JSONDecodeError
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+    HAS_ORJSON = False
+
+
+if HAS_ORJSON:
+
+    def loads(data: Any) -> Any:
+        """Parse JSON from str or bytes"""
+        return orjson.loads(data)
+
+    def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+
+    def dumps(obj: Any) -> str:
+        """Serialize to a compact JSON string"""
+        return orjson.dumps(obj).decode()
+
+    def dumps_pretty(obj: Any) -> str:
+        """Serialize with 2-space indentation for display"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+else:
+
+    def loads(data: Any) -> Any:
+        """Parse JSON from str or bytes"""
+        return json.loads(data)
+
+    def dumps_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes"""
+        return json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys
+        ).encode()
+
+    def dumps(obj: Any) -> str:
+        """Serialize to a compact JSON string"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+    def dumps_pretty(obj: Any) -> str:
+        """Serialize with 2-space indentation for display"""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+__all__ = [
+    "HAS_ORJSON",
+    "JSONDecodeError",
+    "dumps",
+    "dumps_bytes",
+    "dumps_pretty",
+    "loads",
+]
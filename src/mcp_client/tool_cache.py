@@ -0,0 +1,73 @@
+"""
+Tool Discovery Disk Cache
+
+Persists a server's tools/list result across process restarts so short-lived
+CLI runs can skip the discovery round-trip on warm starts.
+"""
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .fastjson import dumps_bytes, loads
+
+DEFAULT_TTL = 3600.0
+
+
+def default_cache_dir() -> Path:
+    """Return $XDG_CACHE_HOME/mcp_client (or ~/.cache/mcp_client)"""
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "mcp_client"
+
+
+class ToolsDiskCache:
+    """File-per-server cache of discovered tools, keyed by URL and server version"""
+
+    def __init__(
+        self,
+        base_url: str,
+        ttl: float = DEFAULT_TTL,
+        cache_dir: Optional[Path] = None,
+    ):
+        self.base_url = base_url
+        self.ttl = ttl
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.logger = logging.getLogger("mcp_client.tool_cache")
+
+    def path(self, version: str = "") -> Path:
+        """Cache file for this server; a version change maps to a new file"""
+        key = hashlib.sha256((self.base_url + version).encode()).hexdigest()
+        return self.cache_dir / f"tools-{key}.json"
+
+    def load(self, version: str = "") -> Optional[List[Dict[str, Any]]]:
+        """Return cached tools if present and younger than the TTL"""
+        path = self.path(version)
+        try:
+            if time.time() - path.stat().st_mtime >= self.ttl:
+                return None
+            tools = loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        return tools if isinstance(tools, list) else None
+
+    def store(self, tools: List[Dict[str, Any]], version: str = "") -> None:
+        """Write tools to disk; failures only disable caching"""
+        path = self.path(version)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(dumps_bytes(tools))
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not write tools cache {path}: {e}")
+
+    def invalidate(self, version: str = "") -> None:
+        """Remove the cache file for this server, if any"""
+        try:
+            self.path(version).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.debug(f"Could not remove tools cache: {e}")
@@ -4,8 +4,8 @@ SSE MCP Client - Búvár-style EventSource client for streaming MCP
 Implements dependency injection, context management, and auto-reconnection
 """
 import asyncio
-import json
 import logging
+import os
 import time
 import uuid
 from contextlib import asynccontextmanager
@@ -15,6 +15,55 @@ from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
 
 import aiohttp
 
+from ..fastjson import JSONDecodeError, loads
+
+# Bytes pulled from the socket per read; one read usually carries many events
+SSE_READ_SIZE = 16384
+
+# Keep-alive pool sizing defaults; MCP_MAX_CONNECTIONS[_PER_HOST] override them
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 30
+CONNECT_TIMEOUT = 5.0
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back on bad values"""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        logging.getLogger("mcp.sse.client").warning(
+            f"Ignoring invalid {name}={raw!r}; using {default}"
+        )
+        return default
+    return value
+
+
+class _LineSplitter:
+    """Accumulates raw SSE bytes and releases complete lines"""
+
+    __slots__ = ("_pending",)
+
+    def __init__(self):
+        self._pending = bytearray()
+
+    def feed(self, chunk: bytes) -> List[str]:
+        """Add one socket read; return the lines it completed, without newlines"""
+        pending = self._pending
+        start = len(pending)
+        pending += chunk
+        # Earlier bytes hold no newline, so only the new region needs a scan
+        cut = pending.rfind(b"\n", start)
+        if cut < 0:
+            return []
+        block = pending[:cut].decode("utf-8")
+        del pending[: cut + 1]
+        return [line.rstrip("\r") for line in block.split("\n")]
+
 
 class StreamState(Enum):
     DISCONNECTED = "disconnected"
@@ -99,8 +148,19 @@ class SSEMCPClient:
     async def session_context(self):
         """Async context manager for HTTP session"""
         if not self.session:
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout, **self.session_kwargs)
+            timeout = aiohttp.ClientTimeout(
+                total=self.timeout, sock_connect=CONNECT_TIMEOUT
+            )
+            kwargs = dict(self.session_kwargs)
+            if "connector" not in kwargs:
+                kwargs["connector"] = aiohttp.TCPConnector(
+                    limit=_env_int("MCP_MAX_CONNECTIONS", MAX_CONNECTIONS),
+                    limit_per_host=_env_int(
+                        "MCP_MAX_CONNECTIONS_PER_HOST", MAX_CONNECTIONS_PER_HOST
+                    ),
+                    ttl_dns_cache=300,
+                )
+            self.session = aiohttp.ClientSession(timeout=timeout, **kwargs)
 
         try:
             yield self.session
@@ -141,8 +201,8 @@ class SSEMCPClient:
         if data_lines:
             data_str = "\n".join(data_lines)
             try:
-                message["data"] = json.loads(data_str) if data_str else None
-            except json.JSONDecodeError:
+                message["data"] = loads(data_str) if data_str else None
+            except JSONDecodeError:
                 message["data"] = data_str
 
         return message if message else None
@@ -198,6 +258,19 @@ class SSEMCPClient:
         async for event in self._stream_endpoint(endpoint, params, handlers):
             yield event
 
+    async def stream_tool_batch(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any] = None,
+        handlers: Dict[str, Callable] = None,
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Stream tool execution, yielding every event parsed from each read at once"""
+        endpoint = f"/stream/tools/{tool_name}"
+        params = arguments or {}
+
+        async for batch in self._stream_endpoint_batches(endpoint, params, handlers):
+            yield batch
+
     async def stream_llm(
         self, prompt: str, model: str = "default", handlers: Dict[str, Callable] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
@@ -228,6 +301,17 @@ class SSEMCPClient:
         handlers: Dict[str, Callable] = None,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Generic endpoint streaming with auto-reconnection"""
+        async for batch in self._stream_endpoint_batches(endpoint, params, handlers):
+            for event in batch:
+                yield event
+
+    async def _stream_endpoint_batches(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        handlers: Dict[str, Callable] = None,
+    ) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Endpoint streaming that yields the events of each socket read as one list"""
         context = SSEStreamContext(base_url=self.base_url, endpoint=endpoint)
 
         # Register stream-specific handlers
@@ -272,28 +356,40 @@ class SSEMCPClient:
                         if stream_id:
                             context.stream_id = stream_id
 
-                        # Process SSE stream
+                        # Process SSE stream in large reads; split lines locally
                         buffer = []
-
-                        async for line in response.content:
-                            line_str = line.decode("utf-8").rstrip("\r\n")
-                            self.logger.debug(f"📜 SSE Line: {repr(line_str)}")
-
-                            if line_str == "":
-                                # Empty line indicates end of message
-                                if buffer:
-                                    self.logger.debug(f"📜 SSE Buffer: {buffer}")
-                                    message = await self._parse_sse_message(buffer)
-                                    self.logger.debug(f"📜 SSE Message: {message}")
-                                    if message:
-                                        event = await self._process_sse_message(
-                                            context, message
-                                        )
-                                        self.logger.debug(f"📜 SSE Event: {event}")
-                                        yield event
-                                    buffer = []
-                            else:
-                                buffer.append(line_str)
+                        splitter = _LineSplitter()
+                        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+                        async for chunk in response.content.iter_chunked(
+                            SSE_READ_SIZE
+                        ):
+                            batch = []
+                            for line_str in splitter.feed(chunk):
+                                if debug:
+                                    self.logger.debug("📜 SSE Line: %r", line_str)
+
+                                if line_str == "":
+                                    # Empty line indicates end of message
+                                    if buffer:
+                                        if debug:
+                                            self.logger.debug("📜 SSE Buffer: %s", buffer)
+                                        message = await self._parse_sse_message(buffer)
+                                        if debug:
+                                            self.logger.debug("📜 SSE Message: %s", message)
+                                        if message:
+                                            event = await self._process_sse_message(
+                                                context, message
+                                            )
+                                            if debug:
+                                                self.logger.debug("📜 SSE Event: %s", event)
+                                            batch.append(event)
+                                        buffer = []
+                                else:
+                                    buffer.append(line_str)
+
+                            if batch:
+                                yield batch
 
                         # Stream completed normally
                         context.state = StreamState.COMPLETED
@@ -310,13 +406,15 @@ class SSEMCPClient:
                     context.state = StreamState.ERROR
 
                     # Yield error event
-                    yield {
-                        "event": "error",
-                        "data": {
-                            "error": str(e),
-                            "reconnect_attempt": context.reconnect_attempts,
-                        },
-                    }
+                    yield [
+                        {
+                            "event": "error",
+                            "data": {
+                                "error": str(e),
+                                "reconnect_attempt": context.reconnect_attempts,
+                            },
+                        }
+                    ]
 
                     context.reconnect_attempts += 1
 
@@ -328,10 +426,12 @@ class SSEMCPClient:
 
             if context.reconnect_attempts >= context.max_reconnects:
                 self.logger.error(f"❌ Max reconnection attempts reached")
-                yield {
-                    "event": "error",
-                    "data": {"error": "Max reconnection attempts reached"},
-                }
+                yield [
+                    {
+                        "event": "error",
+                        "data": {"error": "Max reconnection attempts reached"},
+                    }
+                ]
 
     async def _process_sse_message(
         self, context: SSEStreamContext, message: Dict[str, Any]
@@ -360,7 +460,7 @@ class SSEMCPClient:
             try:
                 async with session.get(f"{self.base_url}/tools") as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=loads)
                         tools = data.get("tools", [])
                         return tools
                     else:
@@ -381,16 +481,25 @@ class SSEMCPClient:
         async with self.session_context() as session:
             async with session.get(f"{self.base_url}/health") as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await response.json(loads=loads)
                 else:
                     raise SSEMCPError(f"Health check failed: HTTP {response.status}")
 
+    async def ping_loop(self, interval: float = 10.0) -> None:
+        """Hit /health periodically so the pooled connection stays warm"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.get_health()
+            except Exception as e:
+                self.logger.debug(f"💓 Keepalive ping failed: {e}")
+
     async def get_stats(self) -> Dict[str, Any]:
         """Get server statistics"""
         async with self.session_context() as session:
             async with session.get(f"{self.base_url}/stats") as response:
                 if response.status == 200:
-                    return await response.json()
+                    return await response.json(loads=loads)
                 else:
                     raise SSEMCPError(f"Stats failed: HTTP {response.status}")
 
@@ -509,9 +618,9 @@ async def _stream_tool_interactive(client: SSEMCPClient, tool_name: str):
         # Try JSON first
         if args_input.startswith("{"):
             try:
-                arguments = json.loads(args_input)
+                arguments = loads(args_input)
                 print(f"✅ Parsed as JSON: {arguments}")
-            except json.JSONDecodeError as e:
+            except JSONDecodeError as e:
                 print(f"❌ Invalid JSON: {e}")
                 return
 
@@ -9,7 +9,9 @@ import asyncio
 import json
 import logging
 from dataclasses import dataclass
-from typing import Any, AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional, Union
+
+from ..fastjson import dumps_bytes, loads
 
 
 @dataclass
@@ -18,20 +20,32 @@ class MCPMessage:
 
     method: str
     params: Dict[str, Any]
-    id: Optional[str] = None
+    id: Optional[Union[int, str]] = None
 
-    def to_json(self) -> str:
+    def to_dict(self) -> Dict[str, Any]:
         msg = {"method": self.method, "params": self.params}
-        if self.id:
+        if self.id is not None:
             msg["id"] = self.id
-        return json.dumps(msg)
+        return msg
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def to_bytes(self) -> bytes:
+        """Serialize as a newline-terminated wire frame"""
+        return dumps_bytes(self.to_dict()) + b"\n"
+
+
+# asyncio's default 64 KiB line limit is too small for large tool results
+DEFAULT_READ_LIMIT = 16 * 1024 * 1024
 
 
 class StdioTransport:
     """Async stdio transport for MCP server communication"""
 
-    def __init__(self, server_command: list[str]):
+    def __init__(self, server_command: list[str], read_limit: int = DEFAULT_READ_LIMIT):
         self.server_command = server_command
+        self.read_limit = read_limit
         self.process: Optional[asyncio.subprocess.Process] = None
         self._message_counter = 0
 
@@ -42,6 +56,7 @@ class StdioTransport:
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            limit=self.read_limit,
         )
         logging.info(f"Connected to MCP server: {' '.join(self.server_command)}")
 
@@ -50,10 +65,16 @@ class StdioTransport:
         if not self.process or not self.process.stdin:
             raise RuntimeError("Not connected to server")
 
-        json_msg = message.to_json() + "\n"
-        self.process.stdin.write(json_msg.encode())
+        await self.send_frame(message.to_bytes())
+
+    async def send_frame(self, frame: bytes) -> None:
+        """Send an already serialized, newline-terminated frame"""
+        if not self.process or not self.process.stdin:
+            raise RuntimeError("Not connected to server")
+
+        self.process.stdin.write(frame)
         await self.process.stdin.drain()
-        logging.debug(f"Sent: {json_msg.strip()}")
+        logging.debug("Sent: %s", frame[:-1])
 
     async def read_messages(self) -> AsyncIterator[Dict[str, Any]]:
         """Read messages from MCP server"""
@@ -62,16 +83,16 @@ class StdioTransport:
 
         async for line in self.process.stdout:
             try:
-                message = json.loads(line.decode().strip())
-                logging.debug(f"Received: {message}")
+                message = loads(line)
+                logging.debug("Received: %s", message)
                 yield message
             except json.JSONDecodeError as e:
                 logging.error(f"Invalid JSON received: {line} - {e}")
 
-    def next_id(self) -> str:
+    def next_id(self) -> int:
         """Generate unique message ID"""
         self._message_counter += 1
-        return str(self._message_counter)
+        return self._message_counter
 
     async def close(self) -> None:
         """Close connection to server"""
@@ -7,6 +7,7 @@ for testing both basic MCP protocol and AI-enhanced components.
 import asyncio
 import os
 import pytest
+from dataclasses import replace
 from unittest.mock import AsyncMock, MagicMock
 
 from mcp_client import (
@@ -18,6 +19,10 @@ from mcp_client import (
     ConversationContext,
     LLMClientFactory
 )
+from mcp_client import client as client_module
+from mcp_client.basic_client import BasicMCPClient
+from mcp_client.config import ConfigManager
+from mcp_client.transports import sse as sse_module
 
 
 @pytest.fixture
@@ -169,3 +174,127 @@ class MockSSEClient:
 def mock_sse_client():
     """Mock SSE client fixture"""
     return MockSSEClient()
+
+
+# Unit test doubles shared by the MCPClient / BasicMCPClient tests
+FAKE_TOOLS = [
+    {"name": "echo", "description": "Echo input"},
+    {"name": "lookup", "description": "Static lookup", "cacheable": True},
+]
+
+
+class FakeTransport:
+    """SSETransport double for a healthy server at version 1.0"""
+
+    def __init__(self, *args, **kwargs):
+        self.tool_requests = 0
+        self.closed = False
+
+    async def get_health(self):
+        return {"status": "healthy", "version": "1.0"}
+
+    async def get_tools(self):
+        self.tool_requests += 1
+        return FAKE_TOOLS
+
+    async def disconnect(self):
+        self.closed = True
+
+
+class FakeLLM:
+    """LLM double that records each request and can fail on demand"""
+
+    def __init__(self):
+        self.fail = False
+        self.requests = []
+
+    async def complete(self, messages, tools=None, **kwargs):
+        self.requests.append([(m.role, m.content) for m in messages])
+        if self.fail:
+            raise RuntimeError("boom")
+        return None
+
+    async def stream(self, messages, **kwargs):
+        for chunk in ("hello ", "world"):
+            yield chunk
+
+    async def close(self):
+        pass
+
+
+class FakeSSE:
+    """SSEMCPClient double that records every request BasicMCPClient makes"""
+
+    def __init__(self, *args, **kwargs):
+        self.requests = []
+
+    async def get_health(self):
+        self.requests.append("health")
+        return {"status": "healthy", "version": "1.0"}
+
+    async def get_tools(self):
+        self.requests.append("tools")
+        return FAKE_TOOLS
+
+    async def stream_tool(self, name, arguments):
+        self.requests.append(("call", name))
+        yield {"event": "result", "data": {"result": [name, arguments]}}
+
+    async def disconnect(self):
+        pass
+
+
+@pytest.fixture
+def fake_llm():
+    """The LLM double every client built by make_mcp_client shares"""
+    return FakeLLM()
+
+
+@pytest.fixture
+def fake_transports():
+    """FakeTransports created by make_mcp_client's clients, in order"""
+    return []
+
+
+@pytest.fixture
+def make_mcp_client(monkeypatch, tmp_path, fake_llm, fake_transports):
+    """Factory for MCPClients wired to test doubles; kwargs override AgentConfig"""
+
+    def transport(*args, **kwargs):
+        fake_transports.append(FakeTransport())
+        return fake_transports[-1]
+
+    monkeypatch.setattr(client_module, "SSETransport", transport)
+    monkeypatch.setattr(
+        client_module.LLMClientFactory, "create_client", staticmethod(lambda cfg: fake_llm)
+    )
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    def make(**overrides) -> MCPClient:
+        config = replace(ConfigManager.create_openai_config("test-key"), **overrides)
+        return MCPClient(config)
+
+    return make
+
+
+@pytest.fixture
+def fake_sse_server(monkeypatch, tmp_path):
+    """Route BasicMCPClient.connect() to FakeSSE with the TCP probe skipped"""
+
+    async def no_probe(self):
+        return None
+
+    monkeypatch.setattr(sse_module, "SSEMCPClient", FakeSSE)
+    monkeypatch.setattr(BasicMCPClient, "_probe", no_probe)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return FakeSSE
+
+
+
+@pytest.fixture
+def basic_client():
+    """BasicMCPClient already holding a FakeSSE and FAKE_TOOLS"""
+    client = BasicMCPClient()
+    client.client = FakeSSE()
+    client._set_tools(FAKE_TOOLS)
+    return client
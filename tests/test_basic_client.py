@@ -0,0 +1,27 @@
+"""
+Unit tests for BasicMCPClient's tools disk cache
+"""
+from mcp_client.basic_client import BasicMCPClient
+
+
+async def test_disk_cache_skips_tools_list_on_warm_start(fake_sse_server, monkeypatch):
+    monkeypatch.setenv("MCP_TOOLS_DISK_CACHE", "true")
+
+    cold = BasicMCPClient()
+    assert await cold.connect()
+    warm = BasicMCPClient()
+    assert await warm.connect()
+
+    assert cold.client.requests == ["health", "tools"]
+    assert warm.client.requests == ["health"]
+    assert warm.tools_cache == cold.tools_cache
+
+
+async def test_disk_cache_is_off_by_default(fake_sse_server, monkeypatch, tmp_path):
+    monkeypatch.delenv("MCP_TOOLS_DISK_CACHE", raising=False)
+
+    client = BasicMCPClient()
+    assert await client.connect()
+
+    assert client.disk_cache is None
+    assert not (tmp_path / "mcp_client").exists()
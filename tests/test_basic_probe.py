@@ -0,0 +1,27 @@
+"""
+Unit tests for BasicMCPClient's pre-request TCP probe
+"""
+import asyncio
+
+from mcp_client.basic_client import BasicMCPClient
+
+
+async def test_refused_port_fails_before_any_request(fake_sse_server, monkeypatch):
+    async def refused(self):
+        return ConnectionRefusedError("refused")
+
+    monkeypatch.setattr(BasicMCPClient, "_probe", refused)
+    client = BasicMCPClient()
+
+    assert not await client.connect()
+    assert client.client.requests == []
+
+
+async def test_probe_accepts_a_listening_port():
+    server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        assert await BasicMCPClient(f"http://127.0.0.1:{port}")._probe() is None
+    finally:
+        server.close()
+        await server.wait_closed()
@@ -0,0 +1,43 @@
+"""
+Unit tests for batched chat streaming and its use by CLIAgent
+"""
+from mcp_client.agent import CLIAgent
+from mcp_client.client import ChatContext
+from mcp_client.config import ConfigManager
+
+TOOLS = [{"name": "echo", "description": "Echo input"}]
+
+
+async def test_chat_stream_batched_yields_every_event_in_order(make_mcp_client):
+    client = make_mcp_client()
+    client._ensure_clients()
+    ctx = ChatContext(available_tools=TOOLS)
+
+    batches = [batch async for batch in client.chat_stream_batched("hi", ctx)]
+
+    assert all(batches)
+    assert [event["content"] for batch in batches for event in batch] == [
+        "hello ",
+        "world",
+    ]
+
+
+async def test_agent_chat_closes_the_stream_on_error(make_mcp_client):
+    closed = []
+
+    async def failing_batches(message, context):
+        try:
+            yield [{"type": "error", "content": "❌ Error: boom"}]
+            yield [{"type": "chunk", "content": "never read"}]
+        finally:
+            closed.append(True)
+
+    agent = CLIAgent(ConfigManager.create_openai_config("test-key"))
+    agent.client = make_mcp_client()
+    agent.client.chat_stream_batched = failing_batches
+    agent.context = ChatContext()
+    agent.session_active = True
+
+    assert await agent.chat("hi") == "❌ Error: boom"
+    assert closed == [True]
+    assert agent.context.roles == []
@@ -0,0 +1,135 @@
+"""
+Unit tests for ChatContext request building and MCPClient chat turns
+"""
+import pytest
+
+from mcp_client.client import _SYSTEM_MESSAGE, ChatContext
+from mcp_client.llm import LLMMessage
+
+SYSTEM = LLMMessage(role="system", content="sys")
+TOOLS = [{"name": "echo", "description": "Echo input"}]
+
+
+def test_request_messages_is_fresh_per_call():
+    ctx = ChatContext()
+    ctx.add_message("user", "hi")
+
+    first = ctx.request_messages(SYSTEM)
+    first.append(LLMMessage(role="user", content="transient"))
+    second = ctx.request_messages(SYSTEM)
+
+    assert [m.content for m in second] == ["sys", "hi"]
+
+
+def test_request_messages_tracks_history_changes():
+    ctx = ChatContext()
+    ctx.add_message("user", "a")
+    ctx.add_message("assistant", "b")
+    assert len(ctx.request_messages(SYSTEM)) == 3
+
+    ctx.add_message("user", "c")
+    assert [m.content for m in ctx.request_messages(SYSTEM)] == ["sys", "a", "b", "c"]
+
+    ctx.roles[:] = ["user"]
+    ctx.contents[:] = ["z"]
+    assert [m.content for m in ctx.request_messages(SYSTEM)] == ["sys", "z"]
+
+    ctx.clear_messages()
+    assert [m.content for m in ctx.request_messages(SYSTEM)] == ["sys"]
+
+
+
+def test_request_messages_after_truncate_then_append():
+    ctx = ChatContext()
+    for i in range(4):
+        ctx.add_message("user", f"m{i}")
+    ctx.request_messages(SYSTEM)
+
+    del ctx.roles[:2]
+    del ctx.contents[:2]
+    ctx.add_message("user", "m4")
+    ctx.add_message("user", "m5")
+
+    assert [m.content for m in ctx.request_messages(SYSTEM)] == [
+        "sys",
+        "m2",
+        "m3",
+        "m4",
+        "m5",
+    ]
+
+
+def test_request_messages_after_in_place_rewrite():
+    ctx = ChatContext()
+    ctx.add_message("user", "a")
+    ctx.add_message("assistant", "b")
+    ctx.request_messages(SYSTEM)
+
+    ctx.contents[1] = "edited"
+
+    assert [m.content for m in ctx.request_messages(SYSTEM)] == ["sys", "a", "edited"]
+
+async def test_error_turn_does_not_leak_into_next_request(make_mcp_client, fake_llm):
+    fake_llm.fail = True
+    client = make_mcp_client()
+    client._ensure_clients()
+    ctx = ChatContext(available_tools=TOOLS)
+
+    text, ctx = await client.chat("first", ctx)
+    assert text.startswith("❌ Error")
+    assert ctx.roles == []
+
+    fake_llm.fail = False
+    text, ctx = await client.chat("second", ctx)
+
+    assert text == "hello world"
+    assert fake_llm.requests[-1] == [("system", _SYSTEM_MESSAGE.content), ("user", "second")]
+    assert ctx.roles == ["user", "assistant"]
+
+
+async def test_successful_turns_accumulate_history(make_mcp_client, fake_llm):
+    client = make_mcp_client()
+    client._ensure_clients()
+    ctx = ChatContext(available_tools=TOOLS)
+
+    await client.chat("one", ctx)
+    await client.chat("two", ctx)
+
+    assert [role for role, _ in fake_llm.requests[-1]] == [
+        "system",
+        "user",
+        "assistant",
+        "user",
+    ]
+    assert ctx.contents == ["one", "hello world", "two", "hello world"]
+
+
+def test_openai_tools_cache_follows_the_source_list(make_mcp_client):
+    client = make_mcp_client()
+    tools = [{"name": "echo"}]
+
+    first = client._get_openai_tools(tools)
+    assert client._get_openai_tools(tools) is first
+
+    tools.append({"name": "search"})
+    assert [t["function"]["name"] for t in client._get_openai_tools(tools)] == [
+        "echo",
+        "search",
+    ]
+
+    other = [{"name": "calculator"}, {"name": "clock"}]
+    assert [t["function"]["name"] for t in client._get_openai_tools(other)] == [
+        "calculator",
+        "clock",
+    ]
+
+
+def test_messages_is_a_read_only_snapshot():
+    ctx = ChatContext()
+    ctx.add_message("user", "hi")
+
+    messages = ctx.messages
+    assert isinstance(messages, tuple)
+    assert [(m.role, m.content) for m in messages] == [("user", "hi")]
+    with pytest.raises(AttributeError):
+        messages.append(LLMMessage(role="user", content="lost"))
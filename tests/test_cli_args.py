@@ -0,0 +1,48 @@
+"""
+Unit tests for the CLI key=value argument parsers
+"""
+import pytest
+
+from mcp_client.basic_client import _parse_kv
+from mcp_client.enhanced_basic_client import _KV_RE, _coerce
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("42", 42),
+        ("3.14", 3.14),
+        ("5.", 5.0),
+        (".5", 0.5),
+        ("true", True),
+        ("FALSE", False),
+        ("hello", "hello"),
+        ("", ""),
+    ],
+)
+def test_coerce_accepts_the_cli_grammar(value, expected):
+    result = _coerce(value)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "value", ["1_000", "1e5", " 5", "+3", "-3", "nan", "inf", "1.2.3", "."]
+)
+def test_coerce_leaves_other_numbers_as_text(value):
+    assert _coerce(value) == value
+
+
+def test_kv_regex_splits_tokens():
+    args = {m.group(1): _coerce(m.group(2)) for m in _KV_RE.finditer("a=1 b=x=y  c=")}
+    assert args == {"a": 1, "b": "x=y", "c": ""}
+
+
+def test_parse_kv_pairs():
+    assert _parse_kv("name=Ada  style=excited") == {"name": "Ada", "style": "excited"}
+    assert _parse_kv("expr=1+1=2") == {"expr": "1+1=2"}
+
+
+def test_parse_kv_bare_word_becomes_query():
+    assert _parse_kv("weather in Paris") == {"query": "weather in Paris"}
+    assert _parse_kv("") == {}
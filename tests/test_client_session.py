@@ -0,0 +1,27 @@
+"""
+Unit tests for MCPClient session lifetime
+"""
+
+
+async def test_session_closes_clients_on_exit(make_mcp_client):
+    client = make_mcp_client()
+
+    async with client.session():
+        transport = client.transport
+
+    assert transport.closed
+    assert client.transport is None
+    assert client.llm_client is None
+
+
+async def test_nested_sessions_share_clients(make_mcp_client, fake_transports):
+    client = make_mcp_client()
+
+    async with client.session():
+        async with client.session():
+            pass
+        assert client.transport is not None
+        assert not client.transport.closed
+
+    assert client.transport is None
+    assert len(fake_transports) == 1
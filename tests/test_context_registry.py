@@ -0,0 +1,50 @@
+"""
+Unit tests for hierarchical ContextRegistry lookups
+"""
+import pytest
+
+from mcp_client.core import ContextRegistry
+
+
+def test_child_resolves_own_then_parent_values():
+    parent = ContextRegistry()
+    parent.register("a", 1)
+    parent.register("b", 2)
+    child = parent.create_child()
+    child.register("b", 3)
+
+    assert child.resolve("a") == 1
+    assert child.resolve("b") == 3
+    with pytest.raises(KeyError):
+        child.resolve("missing")
+
+
+def test_values_registered_after_linking_are_visible():
+    parent = ContextRegistry()
+    child = parent.create_child()
+
+    parent.register("late", "value")
+    assert child.resolve("late") == "value"
+
+
+def test_grandparent_attached_later_is_visible():
+    grandparent = ContextRegistry()
+    grandparent.register("root", "value")
+    parent = ContextRegistry()
+    child = parent.create_child()
+    with pytest.raises(KeyError):
+        child.resolve("root")
+
+    parent.set_parent(grandparent)
+    assert child.resolve("root") == "value"
+
+
+def test_reparenting_replaces_the_old_ancestor():
+    first, second = ContextRegistry(), ContextRegistry()
+    first.register("name", "first")
+    second.register("name", "second")
+    child = first.create_child()
+    assert child.resolve("name") == "first"
+
+    child.set_parent(second)
+    assert child.resolve("name") == "second"
@@ -0,0 +1,57 @@
+"""
+Unit tests for the stdio protocol client's pipelined tool calls
+"""
+import asyncio
+import json
+
+from mcp_client.core.protocol import MCPClient
+
+
+class FakeStdioTransport:
+    """Answers each tools/call frame, replying in reverse order"""
+
+    def __init__(self):
+        self._id = 0
+        self.writes = []
+        self._responses: asyncio.Queue = asyncio.Queue()
+
+    def next_id(self) -> int:
+        self._id += 1
+        return self._id
+
+    async def send_frame(self, frame: bytes) -> None:
+        self.writes.append(frame)
+        requests = [json.loads(line) for line in frame.splitlines() if line]
+        for request in reversed(requests):
+            params = request["params"]
+            self._responses.put_nowait(
+                {"id": request["id"], "result": {"echo": [params["name"], params["arguments"]]}}
+            )
+
+    async def read_messages(self):
+        while True:
+            yield await self._responses.get()
+
+    async def close(self) -> None:
+        pass
+
+
+async def test_call_tools_sends_one_write_and_keeps_call_order():
+    transport = FakeStdioTransport()
+    client = MCPClient(transport)
+    await client.start_response_handler()
+
+    try:
+        results = await client.call_tools(
+            [("echo", {"text": "a"}), ("search", {"q": "b"}), ("echo", {})]
+        )
+    finally:
+        await client.close()
+
+    assert len(transport.writes) == 1
+    assert results == [
+        {"echo": ["echo", {"text": "a"}]},
+        {"echo": ["search", {"q": "b"}]},
+        {"echo": ["echo", {}]},
+    ]
+    assert client._pending_requests == {}
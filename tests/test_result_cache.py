@@ -0,0 +1,33 @@
+"""
+Unit tests for BasicMCPClient's LRU cache of tool results
+"""
+from mcp_client import basic_client as basic_module
+
+
+async def test_cacheable_results_are_reused(basic_client):
+    first = await basic_client.call_tool("lookup", {"key": "a"})
+    second = await basic_client.call_tool("lookup", {"key": "a"})
+
+    assert first == second == ["lookup", {"key": "a"}]
+    assert basic_client.client.requests.count(("call", "lookup")) == 1
+
+
+async def test_uncacheable_results_are_not_reused(basic_client):
+    await basic_client.call_tool("echo")
+    await basic_client.call_tool("echo")
+
+    assert basic_client.client.requests.count(("call", "echo")) == 2
+
+
+async def test_result_cache_evicts_least_recently_used(basic_client, monkeypatch):
+    monkeypatch.setattr(basic_module, "RESULT_CACHE_SIZE", 2)
+
+    await basic_client.call_tool("lookup", {"key": "a"})
+    await basic_client.call_tool("lookup", {"key": "b"})
+    await basic_client.call_tool("lookup", {"key": "a"})  # Refreshes "a"
+    await basic_client.call_tool("lookup", {"key": "c"})  # Evicts "b"
+    await basic_client.call_tool("lookup", {"key": "a"})
+    await basic_client.call_tool("lookup", {"key": "b"})
+
+    assert basic_client.client.requests.count(("call", "lookup")) == 4
+    assert basic_client.clear_result_cache() == 2
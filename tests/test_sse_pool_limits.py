@@ -0,0 +1,18 @@
+"""
+Unit tests for the SSE transport's connection pool limits
+"""
+from mcp_client.transports.sse import _env_int
+
+
+def test_env_int_parses_positive_integers(monkeypatch):
+    monkeypatch.setenv("MCP_MAX_CONNECTIONS", "12")
+    assert _env_int("MCP_MAX_CONNECTIONS", 100) == 12
+
+
+def test_env_int_falls_back_on_bad_values(monkeypatch):
+    monkeypatch.delenv("MCP_MAX_CONNECTIONS", raising=False)
+    assert _env_int("MCP_MAX_CONNECTIONS", 100) == 100
+
+    for raw in ("lots", "", "0", "-5"):
+        monkeypatch.setenv("MCP_MAX_CONNECTIONS", raw)
+        assert _env_int("MCP_MAX_CONNECTIONS", 100) == 100
@@ -0,0 +1,38 @@
+"""
+Unit tests for the SSE transport's line splitter
+"""
+from mcp_client.transports.sse import _LineSplitter
+
+
+def test_partial_line_is_held_until_newline():
+    splitter = _LineSplitter()
+
+    assert splitter.feed(b"event: sta") == []
+    assert splitter.feed(b"rted\ndata: {") == ["event: started"]
+    assert splitter.feed(b"}\n\n") == ["data: {}", ""]
+
+
+def test_crlf_and_blank_lines():
+    splitter = _LineSplitter()
+
+    assert splitter.feed(b"event: x\r\ndata: 1\r\n\r\n") == ["event: x", "data: 1", ""]
+
+
+def test_multibyte_character_split_across_reads():
+    data = "data: é\n".encode()
+    splitter = _LineSplitter()
+
+    assert splitter.feed(data[:7]) == []
+    assert splitter.feed(data[7:]) == ["data: é"]
+
+
+def test_many_small_reads_match_one_large_read():
+    payload = b"event: a\ndata: 1\n\n" * 50
+    splitter = _LineSplitter()
+
+    lines = []
+    for i in range(0, len(payload), 3):
+        lines.extend(splitter.feed(payload[i : i + 3]))
+
+    assert lines == _LineSplitter().feed(payload)
+
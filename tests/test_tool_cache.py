@@ -0,0 +1,64 @@
+"""
+Unit tests for the tools disk cache and MCPClient's use of it
+"""
+import os
+import time
+
+from mcp_client.tool_cache import ToolsDiskCache
+
+TOOLS = [{"name": "echo", "description": "Echo input"}]
+
+
+def test_store_and_load_round_trip(tmp_path):
+    cache = ToolsDiskCache("http://localhost:8081", cache_dir=tmp_path)
+
+    assert cache.load("1.0") is None
+    cache.store(TOOLS, "1.0")
+
+    assert cache.load("1.0") == TOOLS
+
+
+def test_key_includes_url_and_version(tmp_path):
+    cache = ToolsDiskCache("http://localhost:8081", cache_dir=tmp_path)
+    cache.store(TOOLS, "1.0")
+
+    assert cache.load("2.0") is None
+    assert ToolsDiskCache("http://other:8081", cache_dir=tmp_path).load("1.0") is None
+
+
+def test_expired_entry_is_ignored(tmp_path):
+    cache = ToolsDiskCache("http://localhost:8081", ttl=60, cache_dir=tmp_path)
+    cache.store(TOOLS, "1.0")
+    old = time.time() - 120
+    os.utime(cache.path("1.0"), (old, old))
+
+    assert cache.load("1.0") is None
+
+
+def test_corrupt_file_is_ignored_and_invalidate_removes_it(tmp_path):
+    cache = ToolsDiskCache("http://localhost:8081", cache_dir=tmp_path)
+    cache.path("1.0").write_bytes(b"{not json")
+
+    assert cache.load("1.0") is None
+    cache.invalidate("1.0")
+    assert not cache.path("1.0").exists()
+    cache.invalidate("1.0")
+
+
+async def test_client_disk_cache_is_opt_in(make_mcp_client, tmp_path):
+    client = make_mcp_client()
+
+    async with client.session():
+        assert client._tools_cache
+
+    assert not (tmp_path / "mcp_client").exists()
+
+
+async def test_client_reuses_disk_cache_for_same_server_version(make_mcp_client):
+    async with make_mcp_client(tools_disk_cache=True).session():
+        pass
+
+    client = make_mcp_client(tools_disk_cache=True)
+    async with client.session():
+        assert client._tools_cache
+        assert client.transport.tool_requests == 0